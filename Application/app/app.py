@@ -1,13 +1,27 @@
+from datetime import datetime
+from assets import setup_assets
 from config import create_app
-from models import db
+from facets import rebuild_topic_counts
+from metrics import setup_prometheus
+from models import db, Answer, TopicCount, UserScore
+from replicas import setup_read_routing
+from responses import setup_compression
 from routes import register_routes
+from scores import rebuild_score_aggregates
+from search import rebuild_search_index
 from utils import setup_request_logging, setup_error_handler
 
 app = create_app()
 
+# Registered first so that it runs after every other after_request hook
+setup_compression(app)
+
 # Setup utilities
 setup_request_logging(app)
 setup_error_handler(app)
+setup_prometheus(app)
+setup_read_routing(app)
+setup_assets(app)
 
 # Register routes
 register_routes(app)
@@ -40,8 +54,123 @@ def initialize_database():
             # Handle any other database errors
             print(f"Topic column handling error: {e}")
         
+        # Quizzes from before created_at was always set break the catalog's keyset cursor
+        try:
+            from sqlalchemy import text
+            with db.engine.connect() as conn:
+                # Bound like the column default so that SQLite stores the same text format
+                result = conn.execute(text("UPDATE quiz SET created_at = :now WHERE created_at IS NULL"),
+                                      {'now': datetime.utcnow()})
+                if result.rowcount:
+                    print(f"Set created_at on {result.rowcount} quizzes")
+                if conn.dialect.name == 'postgresql':
+                    conn.execute(text("ALTER TABLE quiz ALTER COLUMN created_at SET NOT NULL"))
+                conn.commit()
+        except Exception as e:
+            print(f"Quiz created_at handling error: {e}")
+        
+        # Add the version counter used by the quiz ETags
+        try:
+            from sqlalchemy import inspect, text
+            with db.engine.connect() as conn:
+                columns = {column['name'] for column in inspect(conn).get_columns('quiz')}
+                
+                if 'version' not in columns:
+                    conn.execute(text("ALTER TABLE quiz ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+                    conn.commit()
+                    print("Added version column to quiz table")
+        except Exception as e:
+            print(f"Version column handling error: {e}")
+        
+        # Collapse duplicate answers left by the old read-then-write path and
+        # enforce one answer per user and question (required by the upsert)
+        try:
+            from sqlalchemy import inspect, text
+            with db.engine.connect() as conn:
+                index_names = {index['name'] for index in inspect(conn).get_indexes('answer')}
+                
+                if 'uq_answer_user_question' not in index_names:
+                    result = conn.execute(text("""
+                        DELETE FROM answer
+                        WHERE id NOT IN (
+                            SELECT MAX(id) FROM answer GROUP BY user_id, question_id
+                        )
+                    """))
+                    print(f"Removed {result.rowcount} duplicate answers")
+                    conn.execute(text(
+                        "CREATE UNIQUE INDEX uq_answer_user_question ON answer (user_id, question_id)"
+                    ))
+                    conn.commit()
+                    print("Added unique (user_id, question_id) index to answer table")
+        except Exception as e:
+            print(f"Answer unique index handling error: {e}")
+        
+        # Create secondary indexes that create_all() skips on existing tables
+        try:
+            with db.engine.connect() as conn:
+                for table in db.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(bind=conn, checkfirst=True)
+                conn.commit()
+        except Exception as e:
+            print(f"Index creation error: {e}")
+        
+        # Score aggregate tables start empty on databases that predate them
+        try:
+            if db.session.query(UserScore).first() is None and db.session.query(Answer).first() is not None:
+                rebuild_score_aggregates()
+                db.session.commit()
+                print("Built score aggregates from existing answers")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Score aggregate handling error: {e}")
+        
+        # Topic facet counts start empty on databases that predate them
+        try:
+            if db.session.query(TopicCount).first() is None:
+                topics = rebuild_topic_counts()
+                db.session.commit()
+                if topics:
+                    print(f"Counted quizzes for {topics} topics")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Topic count handling error: {e}")
+        
+        # The search table (created with the schema) starts empty on existing databases
+        try:
+            from sqlalchemy import text
+            if db.session.execute(text("SELECT 1 FROM quiz_search LIMIT 1")).first() is None:
+                indexed = rebuild_search_index()
+                db.session.commit()
+                if indexed:
+                    print(f"Indexed {indexed} quizzes for search")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Search index handling error: {e}")
+        
         print("Database tables ready!")
 
+@app.cli.command('rebuild-scores')
+def rebuild_scores_command():
+    """Recompute score aggregates from raw answers and report any drift."""
+    drift = rebuild_score_aggregates()
+    db.session.commit()
+    print(f"Score aggregates rebuilt ({drift} rows were out of date)")
+
+@app.cli.command('rebuild-topics')
+def rebuild_topics_command():
+    """Recount quizzes per topic for the topic facets."""
+    topics = rebuild_topic_counts()
+    db.session.commit()
+    print(f"Topic counts rebuilt ({topics} topics)")
+
+@app.cli.command('rebuild-search')
+def rebuild_search_command():
+    """Recreate the search documents of every quiz."""
+    indexed = rebuild_search_index()
+    db.session.commit()
+    print(f"Search index rebuilt ({indexed} quizzes)")
+
 if __name__ == '__main__':
     initialize_database()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Static asset build: minify, content-hash and record the results in a manifest.
+
+    python assets.py
+
+writes static/dist/<path>.<hash>.<ext> for every file under static/ together with
+static/dist/manifest.json. When the manifest exists, url_for('static', ...) emits the
+hashed URLs and those are served with year-long immutable cache headers. Without
+it (e.g. in development) the original files are served as before.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+def minify(path, data):
+    if path.endswith('.min.js') or path.endswith('.min.css'):
+        return data
+    if path.endswith('.js') and rjsmin is not None:
+        return rjsmin.jsmin(data.decode('utf-8')).encode('utf-8')
+    if path.endswith('.css') and rcssmin is not None:
+        return rcssmin.cssmin(data.decode('utf-8')).encode('utf-8')
+    return data
+
+def build_assets(static_dir):
+    """Rebuild static_dir/dist and return the {logical path: hashed path} manifest"""
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != dist_dir)
+        for name in sorted(files):
+            source = os.path.join(root, name)
+            logical = os.path.relpath(source, static_dir).replace(os.sep, '/')
+            with open(source, 'rb') as f:
+                data = minify(logical, f.read())
+
+            stem, ext = os.path.splitext(logical)
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            hashed = f'{DIST_DIR}/{stem}.{digest}{ext}'
+
+            target = os.path.join(static_dir, *hashed.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(data)
+            manifest[logical] = hashed
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+def load_manifest(static_dir):
+    try:
+        with open(os.path.join(static_dir, DIST_DIR, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def setup_assets(app):
+    # Imported here so that the build itself only needs the standard library
+    from flask import request
+
+    app.extensions['asset_manifest'] = load_manifest(app.static_folder)
+
+    @app.url_defaults
+    def fingerprint_static_url(endpoint, values):
+        if endpoint == 'static':
+            hashed = app.extensions['asset_manifest'].get(values.get('filename'))
+            if hashed:
+                values['filename'] = hashed
+
+    @app.after_request
+    def cache_fingerprinted_assets(response):
+        # A hashed file never changes: a new build produces a new URL
+        if request.endpoint == 'static' and request.view_args['filename'].startswith(DIST_DIR + '/'):
+            response.cache_control.public = True
+            response.cache_control.max_age = IMMUTABLE_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+
+if __name__ == '__main__':
+    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+    for logical, hashed in build_assets(static_dir).items():
+        print(f"{logical} -> {hashed} ({os.path.getsize(os.path.join(static_dir, hashed))} bytes)")
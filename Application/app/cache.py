@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+from metrics import CACHE_LOOKUPS
+from utils import log_error
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+class LRUCache:
+    """In-process cache holding at most max_entries values for ttl seconds each.
+
+    Every worker process has its own copy, so a write handled by one worker only
+    invalidates that worker's entry; the others keep theirs until the TTL expires,
+    unless the caller checks entries against the current data (see QuizPayloadCache).
+    The Redis backend shares one copy between all workers.
+    """
+
+    def __init__(self, max_entries=1000, ttl=30):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+class RedisCache:
+    """Cache shared by all workers and replicas in any Redis-protocol server.
+
+    `client` can be any object with Redis' get/set/delete/scan_iter methods, so a
+    local stand-in can replace the server in development and tests. The cache fails
+    open: while the server is unreachable every get is a miss and every write a no-op.
+    """
+
+    # Socket errors that escape redis-py are OSErrors
+    ERRORS = (redis.RedisError, OSError) if redis is not None else (OSError,)
+
+    def __init__(self, url=None, ttl=30, prefix='quizapp:', client=None):
+        if client is None:
+            if redis is None:
+                raise ImportError('The redis package is required for a redis:// QUIZ_CACHE_URL')
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        try:
+            return self.client.get(self.prefix + key)
+        except self.ERRORS as e:
+            log_error('cache_get_failed', e, key=key)
+            return None
+
+    def set(self, key, value):
+        try:
+            self.client.set(self.prefix + key, value, ex=max(int(self.ttl), 1))
+        except self.ERRORS as e:
+            log_error('cache_set_failed', e, key=key)
+
+    def delete(self, key):
+        try:
+            self.client.delete(self.prefix + key)
+        except self.ERRORS as e:
+            log_error('cache_delete_failed', e, key=key)
+
+    def clear(self):
+        try:
+            for key in self.client.scan_iter(match=self.prefix + '*'):
+                self.client.delete(key)
+        except self.ERRORS as e:
+            log_error('cache_clear_failed', e)
+
+class NullCache:
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+def create_cache(config):
+    """Build the backend named by QUIZ_CACHE_URL: 'memory', 'none' or a redis:// URL"""
+    url = config['QUIZ_CACHE_URL']
+    ttl = config['QUIZ_CACHE_TTL_SECONDS']
+    if url == 'none' or ttl <= 0:
+        return NullCache()
+    if url == 'memory':
+        return LRUCache(max_entries=config['QUIZ_CACHE_MAX_ENTRIES'], ttl=ttl)
+    return RedisCache(url, ttl=ttl)
+
+class QuizPayloadCache:
+    """Serialized quiz bodies keyed by quiz id and representation.
+
+    Each entry keeps the ETag it was built for, which embeds the quiz version, and
+    is only served for that ETag. Callers look up the current version (one primary
+    key read), so a worker whose per-process copy missed another worker's
+    invalidation, or that cached a lagging replica's rows, rebuilds the body
+    instead of serving it.
+    """
+
+    VIEWS = ('full', 'player')
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self, quiz_id, view, etag):
+        entry = self.backend.get(f'quiz:{quiz_id}:{view}')
+        if isinstance(entry, bytes):
+            entry = entry.decode()
+        if entry is None:
+            result = 'miss'
+        else:
+            cached_etag, payload = entry.split('\n', 1)
+            result = 'hit' if cached_etag == etag else 'stale'
+        CACHE_LOOKUPS.labels(f'quiz_{view}', result).inc()
+        return payload if result == 'hit' else None
+
+    def set(self, quiz_id, view, etag, payload):
+        # One string so that every backend stores the pair atomically
+        self.backend.set(f'quiz:{quiz_id}:{view}', f'{etag}\n{payload}')
+
+    def invalidate(self, quiz_id):
+        for view in self.VIEWS:
+            self.backend.delete(f'quiz:{quiz_id}:{view}')
+
+    def clear(self):
+        self.backend.clear()
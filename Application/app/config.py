@@ -4,16 +4,65 @@ from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from dotenv import load_dotenv
+from metrics import InstrumentedQueuePool
 from models import db
+from replicas import REPLICA_BIND
+from responses import FastJSONProvider
+from utils import logger
 
 load_dotenv()
 
+def env_flag(name, default):
+    return os.getenv(name, default).lower() in ('1', 'true', 'yes', 'on')
+
+def database_engine_options(database_url, replica=False):
+    """SQLALCHEMY_ENGINE_OPTIONS from DB_* environment variables.
+
+    Sizes are per worker process, and the read replica bind has a pool of its own
+    (DB_REPLICA_POOL_SIZE, DB_REPLICA_MAX_OVERFLOW). A pod therefore holds up to
+    GUNICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW + DB_REPLICA_POOL_SIZE
+    + DB_REPLICA_MAX_OVERFLOW) connections to pgpool when DATABASE_READ_URL is set.
+    SQLite keeps Flask-SQLAlchemy's defaults.
+    """
+    if not database_url or database_url.startswith('sqlite'):
+        return {}
+
+    if replica:
+        pool_size = int(os.getenv('DB_REPLICA_POOL_SIZE', '2'))
+        max_overflow = int(os.getenv('DB_REPLICA_MAX_OVERFLOW', '2'))
+    else:
+        pool_size = int(os.getenv('DB_POOL_SIZE', '5'))
+        max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '5'))
+    options = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': env_flag('DB_POOL_PRE_PING', 'true')
+    }
+    statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000'))
+    if statement_timeout > 0 and database_url.startswith('postgresql'):
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    return options
+
 def create_app():
     app = Flask(__name__, static_folder='static', template_folder='templates', static_url_path='/static')
+    app.json = FastJSONProvider(app)
     
     # Database configuration
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = database_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+    
+    # Optional read-only replica for the heavy read endpoints
+    read_url = os.getenv('DATABASE_READ_URL')
+    if read_url:
+        # Binds do not inherit SQLALCHEMY_ENGINE_OPTIONS
+        app.config['SQLALCHEMY_BINDS'] = {
+            REPLICA_BIND: dict(database_engine_options(read_url, replica=True), url=read_url)
+        }
+    app.config['READ_YOUR_WRITES_SECONDS'] = int(os.getenv('READ_YOUR_WRITES_SECONDS', '5'))
     
     # JWT configuration
     app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY')
@@ -22,6 +71,32 @@ def create_app():
     app.config['JWT_HEADER_NAME'] = 'Authorization'
     app.config['JWT_HEADER_TYPE'] = 'Bearer'
     
+    # Quiz payload cache: 'memory' (per worker), a redis:// URL (shared) or 'none'
+    app.config['QUIZ_CACHE_URL'] = os.getenv('QUIZ_CACHE_URL', 'memory')
+    app.config['QUIZ_CACHE_TTL_SECONDS'] = float(os.getenv('QUIZ_CACHE_TTL_SECONDS', '30'))
+    app.config['QUIZ_CACHE_MAX_ENTRIES'] = int(os.getenv('QUIZ_CACHE_MAX_ENTRIES', '1000'))
+    # Seconds browsers and nginx may reuse the answer-free player payload
+    app.config['QUIZ_PLAYER_MAX_AGE'] = int(os.getenv('QUIZ_PLAYER_MAX_AGE', '30'))
+    # Seconds browsers and proxies may reuse the topic facet counts
+    app.config['QUIZ_TOPICS_MAX_AGE'] = int(os.getenv('QUIZ_TOPICS_MAX_AGE', '60'))
+    # Answer exports streaming at once per worker; each holds a database connection throughout
+    app.config['ANSWER_EXPORT_MAX_CONCURRENT'] = int(os.getenv('ANSWER_EXPORT_MAX_CONCURRENT', '1'))
+    
+    # Password hashing: werkzeug method string (cost included) and the bounded process pool.
+    # Changing the method rehashes each password at its next successful login.
+    app.config['PASSWORD_HASH_METHOD'] = os.getenv('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    app.config['PASSWORD_HASH_WORKERS'] = int(os.getenv('PASSWORD_HASH_WORKERS', '1'))
+    app.config['PASSWORD_HASH_MAX_PENDING'] = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '8'))
+    app.config['PASSWORD_HASH_TIMEOUT'] = float(os.getenv('PASSWORD_HASH_TIMEOUT', '10'))
+    
+    # Response compression (gzip, or brotli when installed) above a size threshold; -1 disables it
+    app.config['COMPRESS_MIN_SIZE'] = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+    app.config['COMPRESS_GZIP_LEVEL'] = int(os.getenv('COMPRESS_GZIP_LEVEL', '6'))
+    app.config['COMPRESS_BROTLI_QUALITY'] = int(os.getenv('COMPRESS_BROTLI_QUALITY', '4'))
+    
+    # Metrics snapshot refresh interval in seconds (0 disables caching)
+    app.config['METRICS_REFRESH_SECONDS'] = float(os.getenv('METRICS_REFRESH_SECONDS', '15'))
+    
     # Development configuration
     CORS(app)
     app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
@@ -33,19 +108,19 @@ def create_app():
     # JWT Error handlers
     @jwt.expired_token_loader
     def expired_token_callback(jwt_header, jwt_payload):
-        print(f"DEBUG: Token expired - {jwt_payload}")
+        logger.debug("Token expired - %s", jwt_payload)
         from flask import jsonify
         return jsonify({'error': 'Token has expired'}), 401
 
     @jwt.invalid_token_loader
     def invalid_token_callback(error):
-        print(f"DEBUG: Invalid token - {error}")
+        logger.debug("Invalid token - %s", error)
         from flask import jsonify
         return jsonify({'error': 'Invalid token'}), 401
 
     @jwt.unauthorized_loader
     def missing_token_callback(error):
-        print(f"DEBUG: Missing token - {error}")
+        logger.debug("Missing token - %s", error)
         from flask import jsonify
         return jsonify({'error': 'Authorization token is required'}), 401
     
@@ -0,0 +1,61 @@
+import csv
+import io
+from models import db, Answer, Question, User
+from utils import json_dumps
+
+EXPORT_BATCH_SIZE = 1000
+ANSWER_EXPORT_FIELDS = (
+    'answer_id', 'user_id', 'first_name', 'last_name', 'question_id',
+    'selected_option', 'is_correct', 'answered_at'
+)
+
+def quiz_answer_batches(quiz_id, batch_size=EXPORT_BATCH_SIZE):
+    """Answer rows of a quiz, batch_size at a time, in no particular order.
+
+    yield_per streams through a server-side cursor on PostgreSQL, so only one batch
+    is ever held in memory. Plain columns instead of ORM objects keep each row cheap;
+    without an ORDER BY the first rows arrive before the whole result is known.
+    """
+    result = db.session.execute(
+        db.select(
+            Answer.id, Answer.user_id, User.first_name, User.last_name, Answer.question_id,
+            Answer.selected_option, Answer.is_correct, Answer.answered_at
+        ).join(Question, Answer.question_id == Question.id).join(
+            User, Answer.user_id == User.id
+        ).where(Question.quiz_id == quiz_id).execution_options(yield_per=batch_size)
+    )
+    yield from result.partitions()
+
+def export_record(row):
+    record = dict(zip(ANSWER_EXPORT_FIELDS, row))
+    record['answered_at'] = record['answered_at'].isoformat() if record['answered_at'] else None
+    return record
+
+def csv_cell(value):
+    # Spreadsheets run cells starting with these characters as formulas
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return "'" + value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return value
+
+def csv_chunks(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(ANSWER_EXPORT_FIELDS)
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([csv_cell(value) for value in row[:-1]] + [row[-1] and row[-1].isoformat()] for row in batch)
+        yield buffer.getvalue()
+
+def ndjson_chunks(batches):
+    for batch in batches:
+        yield ''.join(json_dumps(export_record(row)) + '\n' for row in batch)
+
+# format: (chunk generator, mimetype)
+EXPORT_FORMATS = {
+    'csv': (csv_chunks, 'text/csv'),
+    'ndjson': (ndjson_chunks, 'application/x-ndjson'),
+}
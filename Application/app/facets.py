@@ -0,0 +1,29 @@
+from models import db, Quiz, TopicCount
+from scores import increment
+
+# Topic facet counts, kept up to date by the quiz write routes in the same
+# transaction as the change, so the topic filter never has to scan Quiz
+
+def count_quiz_topic(topic, delta):
+    increment(TopicCount, {'topic': topic}, quiz_count=delta)
+
+def move_quiz_topic(old_topic, new_topic):
+    if old_topic != new_topic:
+        count_quiz_topic(old_topic, -1)
+        count_quiz_topic(new_topic, 1)
+
+def topic_facets():
+    """(topic, quiz_count) rows, most used topic first"""
+    return db.session.execute(
+        db.select(TopicCount.topic, TopicCount.quiz_count).where(
+            TopicCount.quiz_count > 0
+        ).order_by(TopicCount.quiz_count.desc(), TopicCount.topic)
+    ).all()
+
+def rebuild_topic_counts():
+    """Recount quizzes per topic from Quiz; returns the number of topics"""
+    db.session.execute(TopicCount.__table__.delete())
+    return db.session.execute(TopicCount.__table__.insert().from_select(
+        ['topic', 'quiz_count'],
+        db.select(Quiz.topic, db.func.count(Quiz.id)).where(Quiz.topic.isnot(None)).group_by(Quiz.topic)
+    )).rowcount
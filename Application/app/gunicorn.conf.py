@@ -0,0 +1,38 @@
+import glob
+import os
+import tempfile
+
+# Prefork workers, each serving requests on a small thread pool. Defaults suit a
+# pod limited to a fraction of a CPU; raise GUNICORN_WORKERS on bigger machines.
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+worker_class = 'gthread'
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '0'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '0'))
+accesslog = None
+
+# Workers share Prometheus samples through files; set before any worker imports
+# prometheus_client
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'quizapp-prometheus'))
+
+def on_starting(server):
+    multiproc_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    os.makedirs(multiproc_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(multiproc_dir, '*.db')):
+        os.remove(path)
+
+    # Create/migrate the schema once, before any worker is forked
+    from app import app, initialize_database
+    from models import db
+    initialize_database()
+    with app.app_context():
+        # Connections must not be shared with the forked workers
+        db.engine.dispose()
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,150 @@
+import codecs
+import csv
+import json
+import re
+import tempfile
+import zipfile
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# Questions parsed from an upload are inserted this many at a time
+IMPORT_BATCH_SIZE = 500
+READ_CHUNK_SIZE = 64 * 1024
+# Largest single JSON question (or text before the array) kept while waiting for its end
+MAX_JSON_ITEM_SIZE = 1024 * 1024
+# Uploaded workbooks stay in memory up to this size and are spooled to disk beyond it
+XLSX_SPOOL_SIZE = 8 * 1024 * 1024
+# Larger workbooks are refused rather than written to disk
+MAX_XLSX_SIZE = 32 * 1024 * 1024
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+JSON_ARRAY_PREFIX = re.compile(r'\s*(\{\s*"questions"\s*:\s*)?')
+JSON_WHITESPACE = re.compile(r'\s*')
+# What may still continue a number or literal decoded at the end of the buffer
+JSON_SCALAR_TAIL = re.compile(r'[\w.+-]*\s*')
+
+class QuestionImportError(ValueError):
+    """The uploaded file is not valid CSV/JSON/XLSX"""
+
+class QuestionImportTooLarge(QuestionImportError):
+    """The upload has to be stored whole and exceeds the size limit"""
+
+def csv_rows(stream):
+    """Rows of a CSV file with a header line, read line by line"""
+    reader = csv.DictReader(codecs.getreader('utf-8-sig')(stream))
+    try:
+        yield from reader
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise QuestionImportError(f'Invalid CSV: {e}') from e
+
+def json_rows(stream):
+    """Items of a JSON array, or of {"questions": [...]}, decoded one at a time"""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer, pos, eof = '', 0, False
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        if eof or len(buffer) - pos > MAX_JSON_ITEM_SIZE:
+            return False
+        chunk = stream.read(READ_CHUNK_SIZE)
+        eof = not chunk
+        try:
+            buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        except UnicodeDecodeError as e:
+            raise QuestionImportError(f'Invalid JSON: {e}') from e
+        pos = 0
+        return True
+
+    while '[' not in buffer:
+        if not read_more():
+            raise QuestionImportError('Expected a JSON array of questions')
+    start = buffer.index('[')
+    prefix = JSON_ARRAY_PREFIX.fullmatch(buffer, 0, start)
+    if prefix is None:
+        raise QuestionImportError('Expected a JSON array of questions')
+    pos = start + 1
+
+    def next_char():
+        # Skips whitespace; '' once the upload ends
+        nonlocal pos
+        while True:
+            pos = JSON_WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ''
+
+    def next_item():
+        nonlocal pos
+        if not next_char():
+            raise QuestionImportError('Invalid JSON: unterminated array')
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # Most likely the item continues in the next chunk
+                if not read_more():
+                    raise QuestionImportError(f'Invalid JSON: {e.msg}') from e
+                continue
+            # A number or literal cut at the chunk end would decode too early, e.g. "1." as 1,
+            # so it is complete only once the next character is in the buffer
+            if not isinstance(item, (dict, list, str)) and \
+                    JSON_SCALAR_TAIL.match(buffer, end).end() == len(buffer) and read_more():
+                continue
+            pos = end
+            return item
+
+    if next_char() == ']':
+        pos += 1
+    else:
+        while True:
+            yield next_item()
+            char = next_char()
+            pos += 1
+            if char == ']':
+                break
+            if char != ',':
+                raise QuestionImportError('Invalid JSON: expected "," or "]" after a question')
+
+    # Only the closing brace of {"questions": [...]} and whitespace may follow the array
+    if prefix.group(1) is not None:
+        if next_char() != '}':
+            raise QuestionImportError('Invalid JSON: expected "}" after the questions')
+        pos += 1
+    if next_char():
+        raise QuestionImportError('Invalid JSON: unexpected content after the questions')
+
+def xlsx_rows(stream):
+    """Rows of the first worksheet, keyed by the header row"""
+    # A zip archive is read from its end, so the upload has to be stored first
+    with tempfile.SpooledTemporaryFile(max_size=XLSX_SPOOL_SIZE) as upload:
+        size = 0
+        for chunk in iter(lambda: stream.read(READ_CHUNK_SIZE), b''):
+            size += len(chunk)
+            if size > MAX_XLSX_SIZE:
+                raise QuestionImportTooLarge(f'XLSX uploads are limited to {MAX_XLSX_SIZE // (1024 * 1024)} MB')
+            upload.write(chunk)
+        upload.seek(0)
+        try:
+            workbook = openpyxl.load_workbook(upload, read_only=True, data_only=True)
+        except (zipfile.BadZipFile, KeyError, OSError, ValueError) as e:
+            raise QuestionImportError('Invalid XLSX file') from e
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [str(cell).strip() if cell is not None else '' for cell in next(rows, ())]
+            for values in rows:
+                if any(value is not None for value in values):
+                    yield dict(zip(header, values))
+        finally:
+            workbook.close()
+
+IMPORT_FORMATS = {'csv': csv_rows, 'json': json_rows}
+if openpyxl is not None:
+    IMPORT_FORMATS['xlsx'] = xlsx_rows
+
+IMPORT_MIMETYPES = {'text/csv': 'csv', 'application/json': 'json', XLSX_MIMETYPE: 'xlsx'}
@@ -0,0 +1,264 @@
+import os
+import threading
+import time
+from datetime import datetime
+from flask import g, has_request_context, request
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from models import db, User, Quiz, Question, UserScore
+from replicas import REPLICA_BIND
+
+# Under a prefork server every worker writes its samples to PROMETHEUS_MULTIPROC_DIR
+# and a scrape of any worker aggregates them all
+MULTIPROCESS = 'PROMETHEUS_MULTIPROC_DIR' in os.environ
+registry = CollectorRegistry()
+
+REQUEST_LATENCY = Histogram(
+    'quizapp_request_duration_seconds', 'HTTP request latency',
+    ['method', 'endpoint', 'status'], registry=registry
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'quizapp_requests_in_flight', 'Requests currently being handled',
+    ['endpoint'], registry=registry, multiprocess_mode='livesum'
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    'quizapp_db_queries_per_request', 'SQL statements issued per request',
+    ['endpoint'], registry=registry, buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+)
+DB_TIME_PER_REQUEST = Histogram(
+    'quizapp_db_time_per_request_seconds', 'Time spent executing SQL per request',
+    ['endpoint'], registry=registry
+)
+DB_QUERY_DURATION = Histogram(
+    'quizapp_db_query_duration_seconds', 'Duration of individual SQL statements',
+    ['endpoint'], registry=registry, buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+)
+DB_QUERIES = Counter(
+    'quizapp_db_queries', 'SQL statements executed', ['endpoint'], registry=registry
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'quizapp_db_pool_connections', 'Connection pool state',
+    ['bind', 'state'], registry=registry, multiprocess_mode='livesum'
+)
+DB_POOL_SATURATION = Gauge(
+    'quizapp_db_pool_saturation', 'Checked out connections / (pool size + max overflow), busiest worker',
+    ['bind'], registry=registry, multiprocess_mode='livemax'
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'quizapp_db_pool_checkout_wait_seconds', 'Time spent waiting for a pooled connection',
+    registry=registry, buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+)
+PASSWORD_HASH_DURATION = Histogram(
+    'quizapp_password_hash_duration_seconds', 'Password hash/verify time including queueing',
+    ['operation'], registry=registry, buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+PASSWORD_HASH_PENDING = Gauge(
+    'quizapp_password_hash_pending', 'Password hashing jobs queued or running',
+    registry=registry, multiprocess_mode='livesum'
+)
+PASSWORD_HASH_REJECTED = Counter(
+    'quizapp_password_hash_rejected', 'Password hashing jobs rejected because the queue was full',
+    registry=registry
+)
+CACHE_LOOKUPS = Counter(
+    'quizapp_cache_lookups', 'Payload cache lookups', ['cache', 'result'], registry=registry
+)
+DB_POOL_TIMEOUTS = Counter(
+    'quizapp_db_pool_timeouts', 'Checkouts that gave up after pool_timeout', registry=registry
+)
+
+def compute_business_metrics():
+    # Summed here rather than kept in a global row that every answer write would lock
+    correct_answers, total_answers = db.session.execute(db.select(
+        db.func.coalesce(db.func.sum(UserScore.correct_answers), 0),
+        db.func.coalesce(db.func.sum(UserScore.total_answers), 0)
+    )).one()
+    avg_score = correct_answers / total_answers * 100 if total_answers else 0
+
+    return {
+        'total_users': User.query.count(),
+        'total_quizzes': Quiz.query.count(),
+        'total_questions': Question.query.count(),
+        'total_answers': total_answers,
+        'average_score_percentage': round(float(avg_score), 2)
+    }
+
+class MetricsSnapshot:
+    """Business metrics computed by a background thread and served from memory.
+
+    The refresh interval is read from METRICS_REFRESH_SECONDS on every call; a value
+    of 0 or less disables the cache and computes the metrics on each request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.generated_at = None
+        self.thread = None
+        self.pid = None
+
+    @property
+    def interval(self):
+        return self.app.config.get('METRICS_REFRESH_SECONDS', 15)
+
+    def refresh(self):
+        with self.app.app_context():
+            g.db_use_replica = True
+            try:
+                snapshot = compute_business_metrics()
+            finally:
+                db.session.remove()
+        with self.lock:
+            self.snapshot = snapshot
+            self.generated_at = time.time()
+
+    def ensure_refresher(self):
+        # Threads do not survive a fork, so every worker process starts its own
+        if self.thread is not None and self.thread.is_alive() and self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive() and self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name='metrics-refresher', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            interval = self.interval
+            if interval <= 0:
+                return
+            time.sleep(interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                from utils import log_error
+                log_error('metrics_refresh_failed', e)
+
+    def get(self):
+        if self.interval <= 0:
+            return dict(compute_business_metrics(), generated_at=datetime.utcnow().isoformat(), stale_seconds=0)
+
+        self.ensure_refresher()
+        if self.snapshot is None:
+            self.refresh()
+
+        with self.lock:
+            snapshot, generated_at = self.snapshot, self.generated_at
+        return dict(
+            snapshot,
+            generated_at=datetime.utcfromtimestamp(generated_at).isoformat(),
+            stale_seconds=round(time.time() - generated_at, 3)
+        )
+
+
+class BusinessMetricsCollector:
+    """Exposes the cached business metrics snapshot as Prometheus gauges"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def collect(self):
+        metrics = self.snapshot.get()
+        for name in ('total_users', 'total_quizzes', 'total_questions', 'total_answers', 'average_score_percentage'):
+            yield GaugeMetricFamily(f'quizapp_{name}', name.replace('_', ' ').capitalize(), value=metrics[name])
+        yield GaugeMetricFamily(
+            'quizapp_business_metrics_stale_seconds', 'Age of the business metrics snapshot',
+            value=metrics['stale_seconds']
+        )
+
+def prometheus_exposition(snapshot):
+    if MULTIPROCESS:
+        scrape_registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(scrape_registry)
+    else:
+        scrape_registry = CollectorRegistry()
+        scrape_registry.register(registry)
+    scrape_registry.register(BusinessMetricsCollector(snapshot))
+    return generate_latest(scrape_registry)
+
+def request_endpoint():
+    return request.endpoint or 'unmatched'
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited and how often it timed out"""
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        # max_overflow of -1 means unbounded, so saturation is undefined
+        self.capacity = pool_size + max_overflow if max_overflow >= 0 else None
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+def record_pool_state(pool, bind):
+    # QueuePool exposes its counters; SQLite's StaticPool/SingletonThreadPool do not
+    if not hasattr(pool, 'checkedout'):
+        return
+    DB_POOL_CONNECTIONS.labels(bind, 'checked_out').set(pool.checkedout())
+    DB_POOL_CONNECTIONS.labels(bind, 'idle').set(pool.checkedin())
+    DB_POOL_CONNECTIONS.labels(bind, 'overflow').set(max(pool.overflow(), 0))
+    DB_POOL_CONNECTIONS.labels(bind, 'size').set(pool.size())
+    if getattr(pool, 'capacity', None):
+        DB_POOL_SATURATION.labels(bind).set(pool.checkedout() / pool.capacity)
+
+def instrument_engine(engine, bind='primary'):
+    # dispose() replaces engine.pool and the new pool inherits these listeners,
+    # so the state is read from whichever pool the engine has now
+    for name in ('connect', 'checkout', 'checkin', 'close'):
+        event.listen(engine.pool, name, lambda *args: record_pool_state(engine.pool, bind))
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info['query_start_time'].pop()
+    endpoint = request_endpoint() if has_request_context() else 'background'
+    DB_QUERIES.labels(endpoint).inc()
+    DB_QUERY_DURATION.labels(endpoint).observe(duration)
+    if has_request_context() and 'db_queries' in g:
+        g.db_queries += 1
+        g.db_time += duration
+
+def setup_prometheus(app):
+    with app.app_context():
+        instrument_engine(db.engine)
+        if REPLICA_BIND in db.engines:
+            instrument_engine(db.engines[REPLICA_BIND], bind=REPLICA_BIND)
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start_time = time.perf_counter()
+        g.db_queries = 0
+        g.db_time = 0.0
+        REQUESTS_IN_FLIGHT.labels(request_endpoint()).inc()
+
+    @app.after_request
+    def record_response_status(response):
+        g.response_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def observe_request(exc):
+        if 'request_start_time' not in g:
+            return
+        endpoint = request_endpoint()
+        REQUESTS_IN_FLIGHT.labels(endpoint).dec()
+        REQUEST_LATENCY.labels(
+            request.method, endpoint, str(g.get('response_status', 500))
+        ).observe(time.perf_counter() - g.request_start_time)
+        DB_QUERIES_PER_REQUEST.labels(endpoint).observe(g.db_queries)
+        DB_TIME_PER_REQUEST.labels(endpoint).observe(g.db_time)
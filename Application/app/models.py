@@ -1,7 +1,8 @@
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from replicas import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -18,17 +19,27 @@ class User(db.Model):
         return f"{self.first_name} {self.last_name}"
 
 class Quiz(db.Model):
+    __table_args__ = (
+        # Keyset pagination of the catalog, optionally filtered by creator or topic
+        db.Index('ix_quiz_created_at_id', 'created_at', 'id'),
+        db.Index('ix_quiz_creator_id_created_at', 'creator_id', 'created_at', 'id'),
+        db.Index('ix_quiz_topic_created_at', 'topic', 'created_at', 'id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     topic = db.Column(db.String(100), nullable=False, default='General')
     creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # NOT NULL: the catalog cursor is (created_at, id)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # Bumped by every change to the quiz or its questions; part of the ETags
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
     questions = db.relationship('Question', backref='quiz', lazy=True, cascade='all, delete-orphan')
 
 class Question(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False)
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False, index=True)
     text = db.Column(db.Text, nullable=False)
     option_a = db.Column(db.String(500), nullable=False)
     option_b = db.Column(db.String(500), nullable=False)
@@ -38,9 +49,34 @@ class Question(db.Model):
     answers = db.relationship('Answer', backref='question', lazy=True)
 
 class Answer(db.Model):
+    __table_args__ = (
+        db.Index('uq_answer_user_question', 'user_id', 'question_id', unique=True),
+        db.Index('ix_answer_user_id_is_correct', 'user_id', 'is_correct'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
+    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False, index=True)
     selected_option = db.Column(db.String(1), nullable=False)
     is_correct = db.Column(db.Boolean, nullable=False)
-    answered_at = db.Column(db.DateTime, default=datetime.utcnow)
\ No newline at end of file
+    answered_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Score aggregates, maintained by scores.py alongside every answer write so
+# that score reads are primary-key lookups instead of scans over Answer
+
+class QuizScore(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), primary_key=True)
+    correct_answers = db.Column(db.Integer, nullable=False, default=0)
+    total_answers = db.Column(db.Integer, nullable=False, default=0)
+
+class UserScore(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    correct_answers = db.Column(db.Integer, nullable=False, default=0)
+    total_answers = db.Column(db.Integer, nullable=False, default=0)
+    quizzes_taken = db.Column(db.Integer, nullable=False, default=0)
+
+class TopicCount(db.Model):
+    # Quizzes per topic for the catalog's topic filter, maintained by facets.py
+    topic = db.Column(db.String(100), primary_key=True)
+    quiz_count = db.Column(db.Integer, nullable=False, default=0)
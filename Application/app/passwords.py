@@ -0,0 +1,107 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+from metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_PENDING, PASSWORD_HASH_REJECTED
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full; the caller should retry later"""
+
+def normalize_method(method):
+    # Spell out werkzeug's defaults so the method can be compared with stored hashes
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        n, r, p = args + ['32768', '8', '1'][len(args):]
+        return f'scrypt:{n}:{r}:{p}'
+    if name == 'pbkdf2':
+        hash_name = args[0] if args else 'sha256'
+        iterations = args[1] if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+    return method
+
+class PasswordHasher:
+    """Password hashing and verification in a bounded pool of worker processes.
+
+    Key stretching is deliberately CPU heavy; running it on request threads lets a
+    burst of logins take all the CPU of a worker. Here at most `workers` hashes run
+    at once, at most `max_pending` may be queued or running, and anything beyond
+    that raises PasswordHasherBusy instead of piling up. With workers=0 hashing
+    runs inline (still bounded). The pool is created lazily in each process.
+    """
+
+    def __init__(self, method='scrypt', workers=1, max_pending=8, timeout=10):
+        self.method = normalize_method(method)
+        self.workers = workers
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pid = None
+
+    def get_executor(self):
+        if self.pid != os.getpid():
+            with self.lock:
+                if self.pid != os.getpid():
+                    # spawn, not fork: the web worker is multi-threaded
+                    self.executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                    )
+                    self.pid = os.getpid()
+        return self.executor
+
+    def discard_executor(self, executor):
+        # A worker died and the pool refuses new work; the next call builds a new one
+        with self.lock:
+            if self.executor is executor:
+                self.executor = None
+                self.pid = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, operation, func, *args):
+        if not self.slots.acquire(blocking=False):
+            PASSWORD_HASH_REJECTED.inc()
+            raise PasswordHasherBusy()
+        PASSWORD_HASH_PENDING.inc()
+        start = time.perf_counter()
+
+        def release(future=None):
+            PASSWORD_HASH_DURATION.labels(operation).observe(time.perf_counter() - start)
+            PASSWORD_HASH_PENDING.dec()
+            self.slots.release()
+
+        if self.workers <= 0:
+            try:
+                return func(*args)
+            finally:
+                release()
+
+        executor = self.get_executor()
+        try:
+            future = executor.submit(func, *args)
+        except BrokenProcessPool as e:
+            release()
+            self.discard_executor(executor)
+            raise PasswordHasherBusy() from e
+        # The slot is held until the job finishes, not until this request stops waiting,
+        # so abandoned jobs still count against max_pending
+        future.add_done_callback(release)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError as e:
+            future.cancel()
+            raise PasswordHasherBusy() from e
+        except BrokenProcessPool as e:
+            self.discard_executor(executor)
+            raise PasswordHasherBusy() from e
+
+    def hash(self, password):
+        return self.run('hash', generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self.run('verify', check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        return password_hash.split('$', 1)[0] != self.method
@@ -0,0 +1,45 @@
+from functools import wraps
+from flask import current_app, g, has_app_context, request
+from flask_sqlalchemy.session import Session
+
+# Bind key of the read-only replica, configured from DATABASE_READ_URL
+REPLICA_BIND = 'replica'
+# Set on a client after a successful write; while present its reads stay on the primary
+READ_YOUR_WRITES_COOKIE = 'read_primary'
+
+class RoutingSession(Session):
+    """Sends queries to the replica bind when the current context asked for it.
+
+    Flushes always go to the primary, so an accidental write inside a replica
+    route still lands on the writable database.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get('db_use_replica'):
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def replica_configured():
+    return REPLICA_BIND in current_app.config.get('SQLALCHEMY_BINDS', {})
+
+def use_read_replica(view):
+    """Run a read-only view against the replica unless the client wrote recently"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_use_replica = READ_YOUR_WRITES_COOKIE not in request.cookies
+        return view(*args, **kwargs)
+    return wrapper
+
+def setup_read_routing(app):
+    @app.after_request
+    def mark_recent_write(response):
+        # Replication lag could hide a write from the client that just made it
+        if (replica_configured() and request.method not in ('GET', 'HEAD', 'OPTIONS')
+                and response.status_code < 400):
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE, '1',
+                max_age=app.config['READ_YOUR_WRITES_SECONDS'], httponly=True, samesite='Lax'
+            )
+        return response
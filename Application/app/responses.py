@@ -0,0 +1,74 @@
+import gzip
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/javascript', 'text/javascript',
+    'text/html', 'text/css', 'text/plain', 'image/svg+xml'
+}
+
+class FastJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider that encodes with orjson when it is installed.
+
+    The output is the same key-sorted compact JSON, except that non-ASCII text is
+    written as UTF-8 rather than \\u escapes. Indented output (debug mode) and any
+    other json.dumps options go through the standard library.
+    """
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs.get('separators', (',', ':')) != (',', ':') or set(kwargs) - {'separators'}:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(
+                obj, default=self.default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(obj, **kwargs)
+
+def negotiate_encoding(accept_encodings):
+    encodings = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return accept_encodings.best_match(encodings)
+
+def compress(data, encoding, config):
+    if encoding == 'br':
+        return brotli.compress(data, quality=config['COMPRESS_BROTLI_QUALITY'])
+    # Fixed mtime so the same body always compresses to the same bytes
+    return gzip.compress(data, compresslevel=config['COMPRESS_GZIP_LEVEL'], mtime=0)
+
+def setup_compression(app):
+    @app.after_request
+    def compress_response(response):
+        min_size = app.config['COMPRESS_MIN_SIZE']
+        if (min_size < 0 or response.status_code != 200 or response.direct_passthrough
+                or response.is_streamed or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        response.set_data(compress(data, encoding, app.config))
+        response.headers['Content-Encoding'] = encoding
+        # A strong ETag names exact bytes; the compressed body is only equivalent
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
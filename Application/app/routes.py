@@ -1,24 +1,208 @@
+import base64
+import hashlib
 import json
+import threading
 from datetime import datetime
-from flask import request, jsonify, render_template
-from flask_jwt_extended import jwt_required, get_jwt_identity, create_access_token
-from werkzeug.security import generate_password_hash, check_password_hash
-from models import db, User, Quiz, Question, Answer
-
-def log_request(status_code, user_id=None):
-    from utils import logger
-    log_data = {
-        'timestamp': datetime.utcnow().isoformat(),
-        'method': request.method,
-        'endpoint': request.endpoint,
-        'url': request.url,
-        'user_id': user_id,
-        'status_code': status_code,
-        'ip': request.remote_addr
+from flask import Response, request, jsonify, render_template, send_from_directory, stream_with_context
+from flask_jwt_extended import jwt_required, create_access_token
+from prometheus_client import CONTENT_TYPE_LATEST
+from sqlalchemy.orm import contains_eager
+from cache import QuizPayloadCache, create_cache
+from exports import EXPORT_FORMATS, quiz_answer_batches
+from facets import count_quiz_topic, move_quiz_topic, topic_facets
+from imports import IMPORT_BATCH_SIZE, IMPORT_FORMATS, IMPORT_MIMETYPES, QuestionImportError, QuestionImportTooLarge
+from models import db, User, Quiz, Question, Answer, QuizScore, UserScore
+from metrics import MetricsSnapshot, prometheus_exposition
+from passwords import PasswordHasher, PasswordHasherBusy
+from replicas import use_read_replica
+from scores import record_answers, remove_question_answers, remove_quiz_answers
+from search import index_quizzes, ranked_quiz_ids, search_terms, unindex_quizzes
+from utils import get_request_user_id, log_error, log_event, logger
+
+QUIZ_PAGE_DEFAULT_LIMIT = 20
+QUIZ_PAGE_MAX_LIMIT = 100
+BULK_QUESTION_LIMIT = 1000
+QUESTION_IMPORT_LIMIT = 10000
+MAX_IMPORT_ERRORS = 50
+VALID_OPTIONS = ('A', 'B', 'C', 'D')
+QUESTION_FIELDS = ('text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_option')
+
+def quiz_catalog_query():
+    # One round trip for the whole catalog: creators are joined in eagerly and
+    # question counts come from a grouped subquery instead of loading questions.
+    question_counts = db.session.query(
+        Question.quiz_id,
+        db.func.count(Question.id).label('question_count')
+    ).group_by(Question.quiz_id).subquery()
+
+    return db.session.query(
+        Quiz,
+        db.func.coalesce(question_counts.c.question_count, 0)
+    ).join(Quiz.creator).options(
+        contains_eager(Quiz.creator)
+    ).outerjoin(question_counts, question_counts.c.quiz_id == Quiz.id)
+
+def serialize_catalog_quiz(quiz, question_count):
+    return {
+        'id': quiz.id,
+        'title': quiz.title,
+        'description': quiz.description,
+        'topic': getattr(quiz, 'topic', 'General'),
+        'creator_id': quiz.creator_id,
+        'creator_name': quiz.creator.full_name,
+        'created_at': quiz.created_at.isoformat(),
+        'question_count': question_count
     }
-    logger.info(json.dumps(log_data))
+
+def bump_quiz_version(quiz_id):
+    # Any change to a quiz or its questions must produce a new ETag
+    db.session.execute(db.update(Quiz).where(Quiz.id == quiz_id).values(version=Quiz.version + 1))
+
+def quiz_etag(quiz, view):
+    prefix = 'quiz' if view == 'full' else f'quiz-{view}'
+    return f'{prefix}-{quiz.id}-v{quiz.version}'
+
+def serialize_quiz(quiz):
+    # Editor representation, including the answer key
+    return {
+        'id': quiz.id,
+        'title': quiz.title,
+        'description': quiz.description,
+        'topic': getattr(quiz, 'topic', 'General'),
+        'creator_id': quiz.creator_id,
+        'created_at': quiz.created_at.isoformat(),
+        'questions': [{
+            'id': q.id,
+            'text': q.text,
+            'option_a': q.option_a,
+            'option_b': q.option_b,
+            'option_c': q.option_c,
+            'option_d': q.option_d,
+            'correct_option': q.correct_option
+        } for q in quiz.questions]
+    }
+
+def serialize_player_quiz(quiz):
+    # What a player needs to take the quiz: no answer key and no creator fields,
+    # so the same body can be cached publicly for everyone
+    return {
+        'id': quiz.id,
+        'title': quiz.title,
+        'description': quiz.description,
+        'topic': getattr(quiz, 'topic', 'General'),
+        'questions': [{
+            'id': q.id,
+            'text': q.text,
+            'option_a': q.option_a,
+            'option_b': q.option_b,
+            'option_c': q.option_c,
+            'option_d': q.option_d
+        } for q in quiz.questions]
+    }
+
+def catalog_etag(rows, *extra):
+    # Everything a catalog body is built from, so equal tags mean identical bodies
+    state = [(q.id, q.version, question_count, q.creator.full_name) for q, question_count in rows]
+    return 'catalog-' + hashlib.sha1(repr((state, extra)).encode()).hexdigest()
+
+def etag_response(etag, build_payload, max_age=None, private=False):
+    """JSON response with a strong ETag; 304 without building the body when the client has it.
+
+    Without max_age clients keep the body but revalidate it on every use; with it the
+    response may be reused by any cache, shared ones included, for max_age seconds.
+    Private responses are never stored by shared caches.
+    """
+    # If-None-Match uses weak comparison, which also matches the W/ tags of compressed responses
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(build_payload(), mimetype='application/json')
+    response.set_etag(etag)
+    if private:
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+    elif max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
+
+def encode_quiz_cursor(quiz):
+    payload = json.dumps([quiz.created_at.isoformat(), quiz.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_quiz_cursor(cursor):
+    try:
+        created_at, quiz_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(quiz_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+def validate_question_data(data):
+    if not isinstance(data, dict) or not all(k in data for k in QUESTION_FIELDS):
+        return 'All question fields required'
+    if any(isinstance(data[k], bool) or not isinstance(data[k], (str, int, float)) for k in QUESTION_FIELDS):
+        return 'Question fields must be text'
+    for field in QUESTION_FIELDS:
+        # Rejected here so one row cannot fail the INSERT of a whole batch
+        max_length = Question.__table__.c[field].type.length
+        if max_length is not None and len(str(data[field])) > max_length:
+            return f'{field} must be at most {max_length} characters'
+    if data['correct_option'] not in ['A', 'B', 'C', 'D']:
+        return 'Correct option must be A, B, C, or D'
+    return None
+
+def normalize_imported_question(row):
+    # Spreadsheet cells may be numbers or padded text; blank cells count as missing.
+    # Other values (lists, objects, booleans, dates) are kept for validation to reject.
+    if not isinstance(row, dict):
+        return row
+    question = {}
+    for field in QUESTION_FIELDS:
+        value = row.get(field)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = str(value)
+        if isinstance(value, str):
+            if value.strip():
+                question[field] = value.strip()
+        elif value is not None:
+            question[field] = value
+    if isinstance(question.get('correct_option'), str):
+        question['correct_option'] = question['correct_option'].upper()
+    return question
+
+def validate_questions(questions):
+    errors = []
+    for index, data in enumerate(questions):
+        error = validate_question_data(data)
+        if error:
+            errors.append({'index': index, 'error': error})
+    return errors
+
+def insert_questions(quiz_id, questions):
+    # A single executemany INSERT in the caller's transaction
+    db.session.execute(Question.__table__.insert(), [
+        dict({field: data[field] for field in QUESTION_FIELDS}, quiz_id=quiz_id)
+        for data in questions
+    ])
 
 def register_routes(app):
+    password_hasher = app.extensions['password_hasher'] = PasswordHasher(
+        method=app.config['PASSWORD_HASH_METHOD'],
+        workers=app.config['PASSWORD_HASH_WORKERS'],
+        max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+        timeout=app.config['PASSWORD_HASH_TIMEOUT']
+    )
+
+    @app.errorhandler(PasswordHasherBusy)
+    def password_hasher_busy(e):
+        response = jsonify({'error': 'Too many sign-in requests, please retry shortly'})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+
     @app.route('/health', methods=['GET'])
     def health_check():
         return jsonify({'status': 'ok'}), 200
@@ -36,18 +220,12 @@ def register_routes(app):
             first_name=data['first_name'],
             last_name=data['last_name'],
             email=data['email'],
-            password_hash=generate_password_hash(data['password'])
+            password_hash=password_hasher.hash(data['password'])
         )
         db.session.add(user)
         db.session.commit()
         
-        from utils import logger
-        logger.info(json.dumps({
-            'event': 'user_registered',
-            'user_id': user.id,
-            'email': user.email,
-            'timestamp': datetime.utcnow().isoformat()
-        }))
+        log_event('user_registered', user_id=user.id, email=user.email)
         
         return jsonify({'message': 'User registered successfully', 'user_id': user.id}), 201
 
@@ -58,17 +236,17 @@ def register_routes(app):
             return jsonify({'error': 'Email and password required'}), 400
         
         user = User.query.filter_by(email=data['email']).first()
-        if not user or not check_password_hash(user.password_hash, data['password']):
+        if not user or not password_hasher.verify(user.password_hash, data['password']):
             return jsonify({'error': 'Invalid credentials'}), 401
         
+        # Upgrade hashes made with an older method or cost while the password is at hand
+        if password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = password_hasher.hash(data['password'])
+            db.session.commit()
+        
         token = create_access_token(identity=str(user.id))
         
-        from utils import logger
-        logger.info(json.dumps({
-            'event': 'user_login',
-            'user_id': user.id,
-            'timestamp': datetime.utcnow().isoformat()
-        }))
+        log_event('user_login', user_id=user.id)
         
         return jsonify({
             'token': token, 
@@ -86,8 +264,19 @@ def register_routes(app):
         if not data or 'title' not in data:
             return jsonify({'error': 'Title required'}), 400
         
-        current_user_id = int(get_jwt_identity())
-        print(f"DEBUG: JWT Identity: {current_user_id}")
+        questions = data.get('questions', [])
+        if not isinstance(questions, list):
+            return jsonify({'error': 'Questions must be a list'}), 400
+        
+        if len(questions) > BULK_QUESTION_LIMIT:
+            return jsonify({'error': f'At most {BULK_QUESTION_LIMIT} questions per request'}), 413
+        
+        errors = validate_questions(questions)
+        if errors:
+            return jsonify({'error': 'Invalid questions', 'errors': errors}), 400
+        
+        current_user_id = get_request_user_id()
+        logger.debug("JWT identity: %s", current_user_id)
         
         try:
             quiz = Quiz(
@@ -100,19 +289,18 @@ def register_routes(app):
                 quiz.topic = data.get('topic', 'General')
             
             db.session.add(quiz)
+            db.session.flush()
+            if questions:
+                insert_questions(quiz.id, questions)
+            index_quizzes([quiz.id])
+            count_quiz_topic(quiz.topic, 1)
             db.session.commit()
         except Exception as e:
-            print(f"Error creating quiz: {e}")
+            log_error('quiz_create_failed', e)
             db.session.rollback()
             return jsonify({'error': 'Failed to create quiz'}), 500
         
-        from utils import logger
-        logger.info(json.dumps({
-            'event': 'quiz_created',
-            'quiz_id': quiz.id,
-            'user_id': get_jwt_identity(),
-            'timestamp': datetime.utcnow().isoformat()
-        }))
+        log_event('quiz_created', quiz_id=quiz.id, user_id=current_user_id)
         
         return jsonify({
             'id': quiz.id,
@@ -120,53 +308,145 @@ def register_routes(app):
             'description': quiz.description,
             'topic': getattr(quiz, 'topic', 'General'),
             'creator_id': quiz.creator_id,
-            'created_at': quiz.created_at.isoformat()
+            'created_at': quiz.created_at.isoformat(),
+            'question_count': len(questions)
         }), 201
 
     @app.route('/quiz', methods=['GET'])
+    @use_read_replica
     def get_quizzes():
+        # Legacy mode: the whole catalog as a plain JSON array
+        if request.args.get('all', '').lower() in ('1', 'true', 'yes'):
+            try:
+                rows = quiz_catalog_query().all()
+                return etag_response(catalog_etag(rows), lambda: app.json.dumps([
+                    serialize_catalog_quiz(q, question_count) for q, question_count in rows
+                ]))
+            except Exception as e:
+                log_error('quiz_catalog_failed', e)
+                return jsonify([]), 200
+
         try:
-            quizzes = Quiz.query.join(User).all()
-            return jsonify([{
-                'id': q.id,
-                'title': q.title,
-                'description': q.description,
-                'topic': getattr(q, 'topic', 'General'),
-                'creator_id': q.creator_id,
-                'creator_name': q.creator.full_name,
-                'created_at': q.created_at.isoformat(),
-                'question_count': len(q.questions)
-            } for q in quizzes]), 200
-        except Exception as e:
-            print(f"Error in get_quizzes: {e}")
-            return jsonify([]), 200
+            limit = int(request.args.get('limit', QUIZ_PAGE_DEFAULT_LIMIT))
+        except ValueError:
+            return jsonify({'error': 'Limit must be an integer'}), 400
+        if limit < 1:
+            return jsonify({'error': 'Limit must be a positive integer'}), 400
+        limit = min(limit, QUIZ_PAGE_MAX_LIMIT)
+
+        query = quiz_catalog_query()
+
+        topic = request.args.get('topic')
+        if topic:
+            query = query.filter(Quiz.topic == topic)
+
+        creator_id = request.args.get('creator_id')
+        if creator_id:
+            try:
+                creator_id = int(creator_id)
+            except ValueError:
+                return jsonify({'error': 'Creator id must be an integer'}), 400
+            query = query.filter(Quiz.creator_id == creator_id)
+
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = decode_quiz_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query = query.filter(db.or_(
+                Quiz.created_at < cursor_created_at,
+                db.and_(Quiz.created_at == cursor_created_at, Quiz.id < cursor_id)
+            ))
+
+        # Fetch one extra row to know whether another page exists
+        rows = query.order_by(Quiz.created_at.desc(), Quiz.id.desc()).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        return etag_response(catalog_etag(rows, has_more, limit), lambda: app.json.dumps({
+            'quizzes': [serialize_catalog_quiz(q, question_count) for q, question_count in rows],
+            'next_cursor': encode_quiz_cursor(rows[-1][0]) if has_more else None,
+            'limit': limit
+        }))
+
+    @app.route('/quiz/topics', methods=['GET'])
+    @use_read_replica
+    def get_quiz_topics():
+        rows = topic_facets()
+        etag = 'topics-' + hashlib.sha1(repr(rows).encode()).hexdigest()
+        return etag_response(etag, lambda: app.json.dumps({
+            'topics': [{'topic': topic, 'quiz_count': quiz_count} for topic, quiz_count in rows]
+        }), app.config['QUIZ_TOPICS_MAX_AGE'])
+
+    @app.route('/quiz/search', methods=['GET'])
+    @use_read_replica
+    def search_quizzes():
+        terms = search_terms(request.args.get('q', ''))
+        if not terms:
+            return jsonify({'error': 'Search query required'}), 400
+        
+        try:
+            limit = int(request.args.get('limit', QUIZ_PAGE_DEFAULT_LIMIT))
+            offset = int(request.args.get('offset', 0))
+        except ValueError:
+            return jsonify({'error': 'Limit and offset must be integers'}), 400
+        if limit < 1 or offset < 0:
+            return jsonify({'error': 'Limit must be positive and offset not negative'}), 400
+        limit = min(limit, QUIZ_PAGE_MAX_LIMIT)
+        
+        # Rank in the search index, then load one page of catalog rows in that order
+        quiz_ids = ranked_quiz_ids(terms, limit + 1, offset)
+        has_more = len(quiz_ids) > limit
+        quiz_ids = quiz_ids[:limit]
+        rows_by_id = {
+            q.id: (q, question_count)
+            for q, question_count in quiz_catalog_query().filter(Quiz.id.in_(quiz_ids)).all()
+        } if quiz_ids else {}
+        rows = [rows_by_id[quiz_id] for quiz_id in quiz_ids if quiz_id in rows_by_id]
+        
+        return etag_response(catalog_etag(rows, terms, offset, has_more), lambda: app.json.dumps({
+            'quizzes': [serialize_catalog_quiz(q, question_count) for q, question_count in rows],
+            'next_offset': offset + limit if has_more else None,
+            'limit': limit
+        }))
+
+    # Serialized quiz details; every write to a quiz or its questions invalidates its entry
+    quiz_cache = app.extensions['quiz_cache'] = QuizPayloadCache(create_cache(app.config))
+
+    def quiz_response(quiz_id, view, serialize, max_age=None, owner_only=False):
+        # owner_only: the view holds the answer key and is sent to the quiz's creator alone
+        quiz = Quiz.query.get_or_404(quiz_id)
+        if owner_only and quiz.creator_id != get_request_user_id():
+            return jsonify({'error': 'Not authorized'}), 403
+        etag = quiz_etag(quiz, view)
+        
+        def build_payload():
+            # Cached bodies are reused only while the quiz is at the version they were built from
+            payload = quiz_cache.get(quiz.id, view, etag)
+            if payload is None:
+                payload = app.json.dumps(serialize(quiz))
+                quiz_cache.set(quiz.id, view, etag, payload)
+            return payload
+        
+        return etag_response(etag, build_payload, max_age, private=owner_only)
 
     @app.route('/quiz/<int:quiz_id>', methods=['GET'])
+    @jwt_required()
+    @use_read_replica
     def get_quiz(quiz_id):
-        quiz = Quiz.query.get_or_404(quiz_id)
-        return jsonify({
-            'id': quiz.id,
-            'title': quiz.title,
-            'description': quiz.description,
-            'topic': getattr(quiz, 'topic', 'General'),
-            'creator_id': quiz.creator_id,
-            'created_at': quiz.created_at.isoformat(),
-            'questions': [{
-                'id': q.id,
-                'text': q.text,
-                'option_a': q.option_a,
-                'option_b': q.option_b,
-                'option_c': q.option_c,
-                'option_d': q.option_d,
-                'correct_option': q.correct_option
-            } for q in quiz.questions]
-        }), 200
+        return quiz_response(quiz_id, 'full', serialize_quiz, owner_only=True)
+
+    @app.route('/quiz/<int:quiz_id>/player', methods=['GET'])
+    @use_read_replica
+    def get_player_quiz(quiz_id):
+        return quiz_response(quiz_id, 'player', serialize_player_quiz, app.config['QUIZ_PLAYER_MAX_AGE'])
 
     @app.route('/quiz/<int:quiz_id>', methods=['PUT'])
     @jwt_required()
     def update_quiz(quiz_id):
         quiz = Quiz.query.get_or_404(quiz_id)
-        if quiz.creator_id != int(get_jwt_identity()):
+        if quiz.creator_id != get_request_user_id():
             return jsonify({'error': 'Not authorized'}), 403
         
         data = request.get_json()
@@ -175,36 +455,41 @@ def register_routes(app):
         if 'description' in data:
             quiz.description = data['description']
         if data.get('topic'):
+            move_quiz_topic(quiz.topic, data['topic'])
             quiz.topic = data['topic']
         
+        bump_quiz_version(quiz_id)
+        index_quizzes([quiz_id])
         db.session.commit()
+        quiz_cache.invalidate(quiz_id)
         return jsonify({'message': 'Quiz updated successfully'}), 200
 
     @app.route('/quiz/<int:quiz_id>', methods=['DELETE'])
     @jwt_required()
     def delete_quiz(quiz_id):
         quiz = Quiz.query.get_or_404(quiz_id)
-        if quiz.creator_id != int(get_jwt_identity()):
+        if quiz.creator_id != get_request_user_id():
             return jsonify({'error': 'Not authorized'}), 403
         
+        remove_quiz_answers(quiz_id)
+        unindex_quizzes([quiz_id])
+        count_quiz_topic(quiz.topic, -1)
         db.session.delete(quiz)
         db.session.commit()
+        quiz_cache.invalidate(quiz_id)
         return jsonify({'message': 'Quiz deleted successfully'}), 200
 
     @app.route('/quiz/<int:quiz_id>/question', methods=['POST'])
     @jwt_required()
     def add_question(quiz_id):
         quiz = Quiz.query.get_or_404(quiz_id)
-        if quiz.creator_id != int(get_jwt_identity()):
+        if quiz.creator_id != get_request_user_id():
             return jsonify({'error': 'Not authorized'}), 403
         
         data = request.get_json()
-        required_fields = ['text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_option']
-        if not data or not all(k in data for k in required_fields):
-            return jsonify({'error': 'All question fields required'}), 400
-        
-        if data['correct_option'] not in ['A', 'B', 'C', 'D']:
-            return jsonify({'error': 'Correct option must be A, B, C, or D'}), 400
+        error = validate_question_data(data)
+        if error:
+            return jsonify({'error': error}), 400
         
         question = Question(
             quiz_id=quiz_id,
@@ -216,7 +501,10 @@ def register_routes(app):
             correct_option=data['correct_option']
         )
         db.session.add(question)
+        bump_quiz_version(quiz_id)
+        index_quizzes([quiz_id])
         db.session.commit()
+        quiz_cache.invalidate(quiz_id)
         
         return jsonify({
             'id': question.id,
@@ -228,11 +516,108 @@ def register_routes(app):
             'correct_option': question.correct_option
         }), 201
 
+    @app.route('/quiz/<int:quiz_id>/questions:bulk', methods=['POST'])
+    @jwt_required()
+    def add_questions_bulk(quiz_id):
+        quiz = Quiz.query.get_or_404(quiz_id)
+        if quiz.creator_id != get_request_user_id():
+            return jsonify({'error': 'Not authorized'}), 403
+        
+        data = request.get_json()
+        questions = data.get('questions') if isinstance(data, dict) else data
+        if not isinstance(questions, list) or not questions:
+            return jsonify({'error': 'A non-empty list of questions is required'}), 400
+        
+        if len(questions) > BULK_QUESTION_LIMIT:
+            return jsonify({'error': f'At most {BULK_QUESTION_LIMIT} questions per request'}), 413
+        
+        errors = validate_questions(questions)
+        if errors:
+            return jsonify({'error': 'Invalid questions', 'errors': errors}), 400
+        
+        try:
+            insert_questions(quiz_id, questions)
+            bump_quiz_version(quiz_id)
+            index_quizzes([quiz_id])
+            db.session.commit()
+        except Exception as e:
+            log_error('question_import_failed', e)
+            db.session.rollback()
+            return jsonify({'error': 'Failed to import questions'}), 500
+        
+        quiz_cache.invalidate(quiz_id)
+        log_event('questions_imported', quiz_id=quiz_id, count=len(questions))
+        
+        return jsonify({'quiz_id': quiz_id, 'created': len(questions)}), 201
+
+    @app.route('/quiz/<int:quiz_id>/questions:import', methods=['POST'])
+    @jwt_required()
+    def import_questions(quiz_id):
+        quiz = Quiz.query.get_or_404(quiz_id)
+        if quiz.creator_id != get_request_user_id():
+            return jsonify({'error': 'Not authorized'}), 403
+        
+        import_format = request.args.get('format') or IMPORT_MIMETYPES.get(request.mimetype)
+        if import_format not in IMPORT_FORMATS:
+            return jsonify({'error': f"Upload one of: {', '.join(IMPORT_FORMATS)}"}), 415
+        
+        # Parse the body as it arrives and insert valid questions in batches, all in
+        # one transaction: an invalid row rolls back everything inserted before it
+        created = 0
+        batch = []
+        errors = []
+        try:
+            for index, row in enumerate(IMPORT_FORMATS[import_format](request.stream)):
+                if index >= QUESTION_IMPORT_LIMIT:
+                    db.session.rollback()
+                    return jsonify({'error': f'At most {QUESTION_IMPORT_LIMIT} questions per import'}), 413
+                
+                question = normalize_imported_question(row)
+                error = validate_question_data(question)
+                if error:
+                    errors.append({'index': index, 'error': error})
+                    if len(errors) >= MAX_IMPORT_ERRORS:
+                        break
+                elif not errors:
+                    batch.append(question)
+                    if len(batch) == IMPORT_BATCH_SIZE:
+                        insert_questions(quiz_id, batch)
+                        created += len(batch)
+                        batch = []
+            
+            if errors:
+                db.session.rollback()
+                return jsonify({'error': 'Invalid questions', 'errors': errors}), 400
+            if batch:
+                insert_questions(quiz_id, batch)
+                created += len(batch)
+            if not created:
+                return jsonify({'error': 'No questions found'}), 400
+            
+            bump_quiz_version(quiz_id)
+            index_quizzes([quiz_id])
+            db.session.commit()
+        except QuestionImportTooLarge as e:
+            db.session.rollback()
+            return jsonify({'error': str(e)}), 413
+        except QuestionImportError as e:
+            db.session.rollback()
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            log_error('question_import_failed', e)
+            db.session.rollback()
+            return jsonify({'error': 'Failed to import questions'}), 500
+        
+        quiz_cache.invalidate(quiz_id)
+        log_event('questions_imported', quiz_id=quiz_id, count=created, format=import_format)
+        
+        return jsonify({'quiz_id': quiz_id, 'created': created}), 201
+
     @app.route('/question/<int:question_id>', methods=['PUT'])
     @jwt_required()
     def update_question(question_id):
         question = Question.query.get_or_404(question_id)
-        if question.quiz.creator_id != int(get_jwt_identity()):
+        if question.quiz.creator_id != get_request_user_id():
             return jsonify({'error': 'Not authorized'}), 403
         
         data = request.get_json()
@@ -254,18 +639,26 @@ def register_routes(app):
                 return jsonify({'error': 'Correct option must be A, B, C, or D'}), 400
             question.correct_option = data['correct_option']
         
+        bump_quiz_version(question.quiz_id)
+        index_quizzes([question.quiz_id])
         db.session.commit()
+        quiz_cache.invalidate(question.quiz_id)
         return jsonify({'message': 'Question updated successfully'}), 200
 
     @app.route('/question/<int:question_id>', methods=['DELETE'])
     @jwt_required()
     def delete_question(question_id):
         question = Question.query.get_or_404(question_id)
-        if question.quiz.creator_id != int(get_jwt_identity()):
+        if question.quiz.creator_id != get_request_user_id():
             return jsonify({'error': 'Not authorized'}), 403
         
+        quiz_id = question.quiz_id
+        remove_question_answers([question_id])
         db.session.delete(question)
+        bump_quiz_version(quiz_id)
+        index_quizzes([quiz_id])
         db.session.commit()
+        quiz_cache.invalidate(quiz_id)
         return jsonify({'message': 'Question deleted successfully'}), 200
 
     @app.route('/quiz/<int:quiz_id>/question/<int:question_id>/answer', methods=['POST'])
@@ -280,55 +673,90 @@ def register_routes(app):
         if data['selected_option'] not in ['A', 'B', 'C', 'D']:
             return jsonify({'error': 'Selected option must be A, B, C, or D'}), 400
         
-        user_id = int(get_jwt_identity())
-        existing_answer = Answer.query.filter_by(user_id=user_id, question_id=question_id).first()
-        
+        user_id = get_request_user_id()
         is_correct = data['selected_option'] == question.correct_option
         
-        if existing_answer:
-            existing_answer.selected_option = data['selected_option']
-            existing_answer.is_correct = is_correct
-            existing_answer.answered_at = datetime.utcnow()
-        else:
-            answer = Answer(
-                user_id=user_id,
-                question_id=question_id,
-                selected_option=data['selected_option'],
-                is_correct=is_correct
-            )
-            db.session.add(answer)
-        
+        record_answers(user_id, quiz_id, {question_id: (data['selected_option'], is_correct)}, datetime.utcnow())
         db.session.commit()
         
-        print(f"DEBUG - Answer stored: user_id={user_id}, quiz_id={quiz_id}, question_id={question_id}, is_correct={is_correct}")
+        logger.debug("Answer stored: user_id=%s, quiz_id=%s, question_id=%s, is_correct=%s",
+                     user_id, quiz_id, question_id, is_correct)
         
-        from utils import logger
-        logger.info(json.dumps({
-            'event': 'question_answered',
-            'user_id': user_id,
-            'quiz_id': quiz_id,
-            'question_id': question_id,
-            'is_correct': is_correct,
-            'timestamp': datetime.utcnow().isoformat()
-        }))
+        log_event('question_answered', user_id=user_id, quiz_id=quiz_id, question_id=question_id, is_correct=is_correct)
         
         return jsonify({'correct': is_correct}), 200
 
+    @app.route('/quiz/<int:quiz_id>/answers', methods=['POST'])
+    @jwt_required()
+    def submit_answers(quiz_id):
+        data = request.get_json()
+        answers = data.get('answers') if isinstance(data, dict) else None
+        if not isinstance(answers, list) or not answers:
+            return jsonify({'error': 'A non-empty list of answers is required'}), 400
+        
+        correct_options = dict(db.session.query(Question.id, Question.correct_option).filter(
+            Question.quiz_id == quiz_id
+        ).all())
+        if not correct_options:
+            return jsonify({'error': 'Quiz not found or has no questions'}), 404
+        
+        errors = []
+        selected = {}
+        for index, answer in enumerate(answers):
+            if not isinstance(answer, dict) or 'question_id' not in answer or 'selected_option' not in answer:
+                errors.append({'index': index, 'error': 'Question id and selected option required'})
+            elif (not isinstance(answer['question_id'], int) or isinstance(answer['question_id'], bool)
+                    or answer['question_id'] not in correct_options):
+                errors.append({'index': index, 'error': 'Question does not belong to this quiz'})
+            elif answer['selected_option'] not in VALID_OPTIONS:
+                errors.append({'index': index, 'error': 'Selected option must be A, B, C, or D'})
+            else:
+                selected[answer['question_id']] = answer['selected_option']
+        if errors:
+            return jsonify({'error': 'Invalid answers', 'errors': errors}), 400
+        
+        user_id = get_request_user_id()
+        answered_at = datetime.utcnow()
+        results = {
+            question_id: option == correct_options[question_id]
+            for question_id, option in selected.items()
+        }
+        
+        # Includes answers stored by earlier requests for this quiz
+        score = record_answers(user_id, quiz_id, {
+            question_id: (option, results[question_id])
+            for question_id, option in selected.items()
+        }, answered_at)
+        db.session.commit()
+        total = len(correct_options)
+        
+        log_event('quiz_answers_submitted', user_id=user_id, quiz_id=quiz_id, answers=len(selected), score=score)
+        
+        # No correct_option here: answers can be resubmitted, so it would give away the key
+        return jsonify({
+            'results': [{
+                'question_id': question_id,
+                'correct': correct
+            } for question_id, correct in results.items()],
+            'score': score,
+            'total': total,
+            'percentage': round(score / total * 100, 2)
+        }), 200
+
     @app.route('/quiz/<int:quiz_id>/score', methods=['GET'])
     @jwt_required()
     def get_quiz_score(quiz_id):
-        user_id = get_jwt_identity()
+        user_id = get_request_user_id()
         quiz = Quiz.query.get_or_404(quiz_id)
         
-        total_questions = len(quiz.questions)
+        total_questions = db.session.execute(
+            db.select(db.func.count(Question.id)).where(Question.quiz_id == quiz.id)
+        ).scalar()
         if total_questions == 0:
             return jsonify({'score': 0, 'total': 0, 'percentage': 0}), 200
         
-        correct_answers = db.session.query(Answer).join(Question).filter(
-            Answer.user_id == user_id,
-            Question.quiz_id == quiz_id,
-            Answer.is_correct == True
-        ).count()
+        quiz_score = db.session.get(QuizScore, (user_id, quiz_id))
+        correct_answers = quiz_score.correct_answers if quiz_score else 0
         
         percentage = (correct_answers / total_questions) * 100 if total_questions > 0 else 0
         
@@ -341,7 +769,7 @@ def register_routes(app):
     @app.route('/user/<int:user_id>', methods=['GET'])
     @jwt_required()
     def get_user_details(user_id):
-        current_user_id = int(get_jwt_identity())
+        current_user_id = get_request_user_id()
         
         if current_user_id != user_id:
             return jsonify({'error': 'Access denied'}), 403
@@ -364,13 +792,13 @@ def register_routes(app):
         if not data or not all(k in data for k in ('current_password', 'new_password')):
             return jsonify({'error': 'Current password and new password required'}), 400
         
-        current_user_id = int(get_jwt_identity())
+        current_user_id = get_request_user_id()
         user = User.query.get(current_user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        if not check_password_hash(user.password_hash, data['current_password']):
+        if not password_hasher.verify(user.password_hash, data['current_password']):
             return jsonify({'error': 'Current password is incorrect'}), 400
         
         if data['current_password'] == data['new_password']:
@@ -379,37 +807,38 @@ def register_routes(app):
         if len(data['new_password']) < 6:
             return jsonify({'error': 'New password must be at least 6 characters long'}), 400
         
-        user.password_hash = generate_password_hash(data['new_password'])
+        user.password_hash = password_hasher.hash(data['new_password'])
         db.session.commit()
         
-        from utils import logger
-        logger.info(json.dumps({
-            'event': 'password_changed',
-            'user_id': user.id,
-            'timestamp': datetime.utcnow().isoformat()
-        }))
+        log_event('password_changed', user_id=user.id)
         
         return jsonify({'message': 'Password changed successfully'}), 200
 
     @app.route('/user/stats', methods=['GET'])
     @jwt_required()
+    @use_read_replica
     def get_user_stats():
-        user_id = int(get_jwt_identity())
-        
-        quizzes_created = Quiz.query.filter_by(creator_id=user_id).count()
-        questions_created = db.session.query(Question).join(Quiz).filter(Quiz.creator_id == user_id).count()
-        
-        user_answers = db.session.query(Answer).filter(Answer.user_id == user_id).all()
-        quiz_ids_answered = set()
-        for answer in user_answers:
-            quiz_ids_answered.add(answer.question.quiz_id)
-        quizzes_taken = len(quiz_ids_answered)
-        
-        total_answers = Answer.query.filter_by(user_id=user_id).count()
-        correct_answers = Answer.query.filter_by(user_id=user_id, is_correct=True).count()
+        user_id = get_request_user_id()
+        
+        # The whole payload in one statement: creator counts and the user's
+        # maintained score aggregate as uncorrelated scalar subqueries
+        def scalar(query):
+            return db.func.coalesce(query.correlate(None).scalar_subquery(), 0)
+        
+        def user_score(column):
+            return scalar(db.select(column).where(UserScore.user_id == user_id))
+        
+        stats = db.session.execute(db.select(
+            scalar(db.select(db.func.count(Quiz.id)).where(Quiz.creator_id == user_id)),
+            scalar(db.select(db.func.count(Question.id)).join(Quiz).where(Quiz.creator_id == user_id)),
+            user_score(UserScore.quizzes_taken),
+            user_score(UserScore.total_answers),
+            user_score(UserScore.correct_answers)
+        )).one()
+        quizzes_created, questions_created, quizzes_taken, total_answers, correct_answers = stats
         average_score = (correct_answers / total_answers * 100) if total_answers > 0 else 0
         
-        print(f"DEBUG - User {user_id}: answers={total_answers}, quizzes_taken={quizzes_taken}")
+        logger.debug("User %s: answers=%s, quizzes_taken=%s", user_id, total_answers, quizzes_taken)
         
         return jsonify({
             'quizzes_created': quizzes_created,
@@ -419,10 +848,48 @@ def register_routes(app):
             'average_score_percentage': round(average_score, 2)
         }), 200
 
+    # Bounds the pooled connections that long downloads can hold
+    export_slots = threading.BoundedSemaphore(app.config['ANSWER_EXPORT_MAX_CONCURRENT'])
+
+    @app.route('/quiz/<int:quiz_id>/answers/export', methods=['GET'])
+    @jwt_required()
+    @use_read_replica
+    def export_quiz_answers(quiz_id):
+        quiz = Quiz.query.get_or_404(quiz_id)
+        if quiz.creator_id != get_request_user_id():
+            return jsonify({'error': 'Not authorized'}), 403
+        
+        export_format = request.args.get('format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'error': f"Format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+        chunks, mimetype = EXPORT_FORMATS[export_format]
+        
+        if not export_slots.acquire(blocking=False):
+            response = jsonify({'error': 'Too many exports in progress, please retry shortly'})
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        
+        def generate():
+            try:
+                yield from chunks(quiz_answer_batches(quiz_id))
+            except Exception as e:
+                # Headers are already sent; the client sees a truncated body
+                log_error('answer_export_failed', e, quiz_id=quiz_id)
+                raise
+        
+        log_event('answers_exported', quiz_id=quiz_id, format=export_format)
+        response = Response(stream_with_context(generate()), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename=quiz-{quiz_id}-answers.{export_format}'
+        # Let nginx pass chunks through as they are produced
+        response.headers['X-Accel-Buffering'] = 'no'
+        # Runs when the download ends, is aborted or never starts
+        response.call_on_close(export_slots.release)
+        return response
+
     @app.route('/debug/answers', methods=['GET'])
     @jwt_required()
     def debug_answers():
-        user_id = int(get_jwt_identity())
+        user_id = get_request_user_id()
         answers = Answer.query.filter_by(user_id=user_id).all()
         
         answer_data = []
@@ -443,24 +910,17 @@ def register_routes(app):
             'answers': answer_data
         }), 200
 
+    metrics_snapshot = app.extensions['metrics_snapshot'] = MetricsSnapshot(app)
+
     @app.route('/metrics', methods=['GET'])
+    @use_read_replica
     def get_metrics():
-        total_users = User.query.count()
-        total_quizzes = Quiz.query.count()
-        total_questions = Question.query.count()
-        total_answers = Answer.query.count()
-        
-        avg_score = db.session.query(db.func.avg(
-            db.case((Answer.is_correct == True, 1), else_=0) * 100
-        )).scalar() or 0
-        
-        return jsonify({
-            'total_users': total_users,
-            'total_quizzes': total_quizzes,
-            'total_questions': total_questions,
-            'total_answers': total_answers,
-            'average_score_percentage': round(float(avg_score), 2)
-        }), 200
+        # Served from memory; refreshed in the background every METRICS_REFRESH_SECONDS
+        return jsonify(metrics_snapshot.get()), 200
+
+    @app.route('/metrics/prometheus', methods=['GET'])
+    def get_prometheus_metrics():
+        return Response(prometheus_exposition(metrics_snapshot), content_type=CONTENT_TYPE_LATEST)
 
     # Template routes
     @app.route('/')
@@ -520,4 +980,5 @@ def register_routes(app):
 
     @app.route('/favicon.ico')
     def favicon():
-        return app.send_static_file('favicon.ico')
\ No newline at end of file
+        # Pages link the fingerprinted icon; this fixed URL is only a fallback
+        return send_from_directory(app.static_folder, 'favicon.ico', max_age=86400)
\ No newline at end of file
@@ -0,0 +1,222 @@
+from collections import defaultdict
+from sqlalchemy import bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+from models import db, Question, Answer, QuizScore, UserScore
+
+def is_postgresql():
+    return db.session.get_bind().dialect.name == 'postgresql'
+
+def dialect_insert(table):
+    return (postgresql if is_postgresql() else sqlite).insert(table)
+
+def insert_new_answers(rows):
+    # INSERT ... ON CONFLICT DO NOTHING; returns the question ids actually inserted
+    stmt = dialect_insert(Answer.__table__).values(rows).on_conflict_do_nothing(
+        index_elements=['user_id', 'question_id']
+    ).returning(Answer.question_id)
+    return set(db.session.execute(stmt).scalars())
+
+def overwrite_answers(user_id, rows):
+    """Overwrite the stored answers of rows; returns their previous is_correct values"""
+    table = Answer.__table__
+    question_ids = [row['question_id'] for row in rows]
+    existing = (table.c.user_id == user_id, table.c.question_id.in_(question_ids))
+    values = {
+        column: db.cast(db.case(
+            {row['question_id']: row[column] for row in rows}, value=table.c.question_id
+        ), table.c[column].type)
+        for column in ('selected_option', 'is_correct', 'answered_at')
+    }
+    if is_postgresql():
+        # The subquery locks the rows and still carries their values from before the update
+        previous = db.select(table.c.id, table.c.is_correct).where(*existing).order_by(
+            table.c.id
+        ).with_for_update().subquery()
+        return db.session.execute(
+            table.update().where(table.c.id == previous.c.id).values(values).returning(previous.c.is_correct)
+        ).scalars().all()
+    # SQLite has no row locks, but the INSERT before this took the database write lock
+    previous = db.session.execute(db.select(table.c.is_correct).where(*existing)).scalars().all()
+    db.session.execute(table.update().where(*existing).values(values))
+    return previous
+
+def increment(model, keys, *returning, **deltas):
+    # Atomic "row += deltas", inserting the row if it does not exist yet;
+    # returns the `returning` columns of the updated row
+    table = model.__table__
+    stmt = dialect_insert(table).values(dict(keys, **deltas))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: table.c[column] + stmt.excluded[column] for column in deltas}
+    )
+    if returning:
+        return db.session.execute(stmt.returning(*[table.c[column] for column in returning])).one()
+    db.session.execute(stmt)
+
+def decrement_many(model, key_columns, rows):
+    # Executemany "row -= deltas" for rows of {key..., delta...}
+    table = model.__table__
+    delta_columns = [c for c in rows[0] if c not in key_columns]
+    stmt = table.update().where(*[
+        table.c[column] == bindparam(f'key_{column}') for column in key_columns
+    ]).values({
+        column: table.c[column] - bindparam(f'delta_{column}') for column in delta_columns
+    })
+    db.session.execute(stmt, [
+        {(f'key_{c}' if c in key_columns else f'delta_{c}'): value for c, value in row.items()}
+        for row in rows
+    ])
+
+def record_answers(user_id, quiz_id, answers, answered_at):
+    """Store answers ({question_id: (selected_option, is_correct)}) and update the aggregates.
+
+    Runs in the caller's transaction and returns the user's correct answers on the
+    quiz afterwards. New answers are inserted first; the ones that already existed
+    are then overwritten in a separate statement that also yields their previous
+    values under a row lock, so a concurrent submission by the same user can neither
+    be missed nor counted twice.
+    """
+    rows = [{
+        'user_id': user_id,
+        'question_id': question_id,
+        'selected_option': selected_option,
+        'is_correct': is_correct,
+        'answered_at': answered_at
+    } for question_id, (selected_option, is_correct) in sorted(answers.items())]
+
+    inserted = insert_new_answers(rows)
+    existing = [row for row in rows if row['question_id'] not in inserted]
+    previous = overwrite_answers(user_id, existing) if existing else []
+
+    total_delta = len(inserted)
+    correct_delta = (
+        sum(1 for _, is_correct in answers.values() if is_correct)
+        - sum(1 for is_correct in previous if is_correct)
+    )
+
+    correct_answers, total_answers = increment(
+        QuizScore, {'user_id': user_id, 'quiz_id': quiz_id}, 'correct_answers', 'total_answers',
+        correct_answers=correct_delta, total_answers=total_delta
+    )
+    # A stored quiz_score row always counts at least one earlier answer, so the row
+    # was just inserted exactly when it holds nothing but this submission's new answers
+    first_attempt = total_answers == total_delta
+    increment(UserScore, {'user_id': user_id},
+              correct_answers=correct_delta, total_answers=total_delta,
+              quizzes_taken=1 if first_attempt else 0)
+    return correct_answers
+
+def subtract_answers(removed):
+    """Subtract deleted answers, as (user_id, quiz_id, is_correct) rows, from the aggregates"""
+    per_quiz = defaultdict(lambda: {'correct_answers': 0, 'total_answers': 0})
+    for user_id, quiz_id, is_correct in removed:
+        per_quiz[user_id, quiz_id]['total_answers'] += 1
+        per_quiz[user_id, quiz_id]['correct_answers'] += 1 if is_correct else 0
+    if not per_quiz:
+        return
+
+    decrement_many(QuizScore, ('user_id', 'quiz_id'), [
+        dict(deltas, user_id=user_id, quiz_id=quiz_id) for (user_id, quiz_id), deltas in per_quiz.items()
+    ])
+
+    # Users left without any answer on a quiz no longer count it as taken
+    emptied = db.session.execute(
+        QuizScore.__table__.delete().where(
+            QuizScore.quiz_id.in_({quiz_id for _, quiz_id in per_quiz}),
+            QuizScore.total_answers <= 0
+        ).returning(QuizScore.user_id)
+    ).scalars().all()
+
+    per_user = defaultdict(lambda: {'correct_answers': 0, 'total_answers': 0, 'quizzes_taken': 0})
+    for (user_id, _), deltas in per_quiz.items():
+        per_user[user_id]['correct_answers'] += deltas['correct_answers']
+        per_user[user_id]['total_answers'] += deltas['total_answers']
+    for user_id in emptied:
+        per_user[user_id]['quizzes_taken'] += 1
+    decrement_many(UserScore, ('user_id',), [
+        dict(deltas, user_id=user_id) for user_id, deltas in per_user.items()
+    ])
+
+# The deletes below return the rows they removed, so an answer committed by a
+# concurrent submission is either deleted and subtracted or left alone, never
+# deleted without being counted.
+
+def remove_question_answers(question_ids):
+    """Delete the answers to the given questions and subtract them from the aggregates"""
+    quiz_ids = dict(db.session.execute(
+        db.select(Question.id, Question.quiz_id).where(Question.id.in_(question_ids))
+    ).all())
+    deleted = db.session.execute(
+        Answer.__table__.delete().where(Answer.question_id.in_(question_ids)).returning(
+            Answer.user_id, Answer.question_id, Answer.is_correct
+        )
+    ).all()
+    subtract_answers([
+        (user_id, quiz_ids[question_id], is_correct) for user_id, question_id, is_correct in deleted
+    ])
+
+def remove_quiz_answers(quiz_id):
+    """Delete every answer to a quiz's questions and subtract them from the aggregates"""
+    deleted = db.session.execute(
+        Answer.__table__.delete().where(
+            Answer.question_id.in_(db.select(Question.id).where(Question.quiz_id == quiz_id))
+        ).returning(Answer.user_id, Answer.is_correct)
+    ).all()
+    subtract_answers([(user_id, quiz_id, is_correct) for user_id, is_correct in deleted])
+
+def rebuild_score_aggregates():
+    """Recompute all aggregates from raw answers.
+
+    Returns the number of aggregate rows that differed from the recomputed values.
+    """
+    quiz_scores = {
+        (user_id, quiz_id): (correct, total)
+        for user_id, quiz_id, total, correct in db.session.execute(
+            db.select(
+                Answer.user_id,
+                Question.quiz_id,
+                db.func.count(Answer.id),
+                db.func.sum(db.case((Answer.is_correct == True, 1), else_=0))
+            ).join(Question, Answer.question_id == Question.id).group_by(Answer.user_id, Question.quiz_id)
+        )
+    }
+
+    user_scores = defaultdict(lambda: [0, 0, 0])
+    for (user_id, _), (correct, total) in quiz_scores.items():
+        user_scores[user_id][0] += correct
+        user_scores[user_id][1] += total
+        user_scores[user_id][2] += 1
+    user_scores = {user_id: tuple(values) for user_id, values in user_scores.items()}
+
+    stored_quiz_scores = {
+        (row.user_id, row.quiz_id): (row.correct_answers, row.total_answers)
+        for row in db.session.execute(db.select(QuizScore.__table__))
+    }
+    stored_user_scores = {
+        row.user_id: (row.correct_answers, row.total_answers, row.quizzes_taken)
+        for row in db.session.execute(db.select(UserScore.__table__))
+    }
+
+    drift = 0
+    for fresh, stored in ((quiz_scores, stored_quiz_scores),
+                          (user_scores, stored_user_scores)):
+        drift += sum(1 for key in fresh.keys() | stored.keys() if fresh.get(key) != stored.get(key))
+
+    for model in (QuizScore, UserScore):
+        db.session.execute(model.__table__.delete())
+
+    if quiz_scores:
+        db.session.execute(QuizScore.__table__.insert(), [{
+            'user_id': user_id,
+            'quiz_id': quiz_id,
+            'correct_answers': correct,
+            'total_answers': total
+        } for (user_id, quiz_id), (correct, total) in quiz_scores.items()])
+        db.session.execute(UserScore.__table__.insert(), [{
+            'user_id': user_id,
+            'correct_answers': correct,
+            'total_answers': total,
+            'quizzes_taken': quizzes_taken
+        } for user_id, (correct, total, quizzes_taken) in user_scores.items()])
+
+    return drift
@@ -0,0 +1,115 @@
+import re
+from sqlalchemy import bindparam, event, text
+from models import db
+
+# One search document per quiz: title, topic, description and the text of its
+# questions. PostgreSQL keeps it as a weighted tsvector behind a GIN index, SQLite
+# in an FTS5 table. Like the score aggregates, documents are refreshed by the
+# write routes in the same transaction as the change.
+
+MAX_SEARCH_TERMS = 8
+
+POSTGRES_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS quiz_search (
+        quiz_id INTEGER PRIMARY KEY REFERENCES quiz (id) ON DELETE CASCADE,
+        document TSVECTOR NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_quiz_search_document ON quiz_search USING GIN (document)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS quiz_search
+    USING fts5(title, topic, description, questions, tokenize='porter unicode61')
+    """,
+]
+
+POSTGRES_INDEX = """
+    INSERT INTO quiz_search (quiz_id, document)
+    SELECT quiz.id,
+           setweight(to_tsvector('english', quiz.title), 'A')
+           || setweight(to_tsvector('english', coalesce(quiz.topic, '')), 'B')
+           || setweight(to_tsvector('english', coalesce(quiz.description, '')), 'C')
+           || setweight(to_tsvector('english', coalesce(string_agg(question.text, ' '), '')), 'D')
+    FROM quiz LEFT JOIN question ON question.quiz_id = quiz.id
+    {where}
+    GROUP BY quiz.id
+    ON CONFLICT (quiz_id) DO UPDATE SET document = excluded.document
+"""
+
+SQLITE_INDEX = """
+    INSERT INTO quiz_search (rowid, title, topic, description, questions)
+    SELECT quiz.id, quiz.title, coalesce(quiz.topic, ''), coalesce(quiz.description, ''),
+           coalesce(group_concat(question.text, ' '), '')
+    FROM quiz LEFT JOIN question ON question.quiz_id = quiz.id
+    {where}
+    GROUP BY quiz.id
+"""
+
+# Best match first; ties (and equal ranks) newest quiz first
+POSTGRES_SEARCH = """
+    SELECT quiz_id FROM quiz_search, to_tsquery('english', :query) AS query
+    WHERE document @@ query
+    ORDER BY ts_rank_cd(document, query) DESC, quiz_id DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+# bm25() is lower for better matches; the weights follow title, topic, description, questions
+SQLITE_SEARCH = """
+    SELECT rowid FROM quiz_search
+    WHERE quiz_search MATCH :query
+    ORDER BY bm25(quiz_search, 10.0, 5.0, 2.0, 1.0), rowid DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+def is_postgresql(bind):
+    return bind.dialect.name == 'postgresql'
+
+@event.listens_for(db.metadata, 'after_create')
+def create_search_table(metadata, connection, **kw):
+    for statement in POSTGRES_DDL if is_postgresql(connection) else SQLITE_DDL:
+        connection.execute(text(statement))
+
+@event.listens_for(db.metadata, 'before_drop')
+def drop_search_table(metadata, connection, **kw):
+    connection.execute(text('DROP TABLE IF EXISTS quiz_search'))
+
+def search_terms(query):
+    # Words only, so user input can never inject tsquery/FTS5 operators
+    return re.findall(r'\w+', query.lower())[:MAX_SEARCH_TERMS]
+
+def unindex_quizzes(quiz_ids):
+    key = 'quiz_id' if is_postgresql(db.session.get_bind()) else 'rowid'
+    db.session.execute(
+        text(f'DELETE FROM quiz_search WHERE {key} IN :ids').bindparams(bindparam('ids', expanding=True)),
+        {'ids': list(quiz_ids)}
+    )
+
+def index_quizzes(quiz_ids):
+    """Rebuild the search documents of quiz_ids from the current rows"""
+    db.session.flush()
+    where = 'WHERE quiz.id IN :ids'
+    if is_postgresql(db.session.get_bind()):
+        statement = text(POSTGRES_INDEX.format(where=where))
+    else:
+        unindex_quizzes(quiz_ids)
+        statement = text(SQLITE_INDEX.format(where=where))
+    db.session.execute(statement.bindparams(bindparam('ids', expanding=True)), {'ids': list(quiz_ids)})
+
+def rebuild_search_index():
+    """Recreate every search document; returns the number of quizzes indexed"""
+    db.session.flush()
+    db.session.execute(text('DELETE FROM quiz_search'))
+    template = POSTGRES_INDEX if is_postgresql(db.session.get_bind()) else SQLITE_INDEX
+    return db.session.execute(text(template.format(where=''))).rowcount
+
+def ranked_quiz_ids(terms, limit, offset=0):
+    """Ids of the quizzes matching every term (as a word prefix), best match first"""
+    if is_postgresql(db.session.get_bind()):
+        sql, query = POSTGRES_SEARCH, ' & '.join(f'{term}:*' for term in terms)
+    else:
+        sql, query = SQLITE_SEARCH, ' '.join(f'"{term}"*' for term in terms)
+    rows = db.session.execute(text(sql), {'query': query, 'limit': limit, 'offset': offset})
+    return [row[0] for row in rows]
@@ -1,9 +1,99 @@
 import json
 import logging
+import os
+import queue
+import random
+import sys
+import threading
 from datetime import datetime
-from flask import request
+from flask import g, request
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+class JsonFormatter(logging.Formatter):
+    # Structured records carry a dict as their message and are encoded here, on
+    # the writer thread, instead of on the request thread
+    def format(self, record):
+        if isinstance(record.msg, dict):
+            return json_dumps(record.msg)
+        return super().format(record)
+
+class AsyncBatchHandler(logging.Handler):
+    """QueueHandler/QueueListener-style handler that writes log lines in batches.
+
+    emit() only enqueues the record; a writer thread drains the queue, encodes up to
+    batch_size records and writes them with a single write/flush. When the bounded
+    queue is full the record is dropped and counted rather than blocking the request.
+    """
+
+    def __init__(self, stream=None, queue_size=10000, batch_size=256):
+        super().__init__()
+        self.stream = stream or sys.stderr
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.writer = None
+        self.writer_pid = None
+        self.writer_lock = threading.Lock()
+
+    def ensure_writer(self):
+        # The writer thread does not survive a fork, so each worker starts its own
+        if self.writer_pid == os.getpid():
+            return
+        with self.writer_lock:
+            if self.writer_pid == os.getpid():
+                return
+            self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self.writer = threading.Thread(target=self.run, name='log-writer', daemon=True)
+            self.writer_pid = os.getpid()
+            self.writer.start()
+
+    def emit(self, record):
+        self.ensure_writer()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.write(batch)
+            for _ in batch:
+                self.queue.task_done()
+
+    def write(self, batch):
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        try:
+            self.stream.write('\n'.join(lines) + '\n')
+            self.stream.flush()
+        except Exception:
+            pass
+
+    def flush(self):
+        # Wait for everything queued so far (used at shutdown and in tests)
+        if self.writer is not None and self.writer.is_alive() and self.writer_pid == os.getpid():
+            self.queue.join()
+
 # Configure JSON logging
 logging.basicConfig(
     level=logging.INFO,
@@ -11,6 +101,27 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]
 )
 logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+
+log_handler = AsyncBatchHandler(
+    queue_size=int(os.getenv('LOG_QUEUE_SIZE', '10000')),
+    batch_size=int(os.getenv('LOG_BATCH_SIZE', '256'))
+)
+log_handler.setFormatter(JsonFormatter('%(message)s'))
+logger.addHandler(log_handler)
+
+# Fraction of successful (< 400) request logs that are kept; errors are always logged
+LOG_SUCCESS_SAMPLE_RATE = float(os.getenv('LOG_SUCCESS_SAMPLE_RATE', '1.0'))
+
+def log_event(event, **fields):
+    logger.info(dict(event=event, **fields, timestamp=datetime.utcnow().isoformat()))
+
+def log_error(event, error, **fields):
+    logger.error(dict(event=event, error=str(error), **fields, timestamp=datetime.utcnow().isoformat()))
+
+def should_log_request(status_code):
+    return status_code >= 400 or LOG_SUCCESS_SAMPLE_RATE >= 1 or random.random() < LOG_SUCCESS_SAMPLE_RATE
 
 def log_request(status_code, user_id=None):
     log_data = {
@@ -22,24 +133,36 @@ def log_request(status_code, user_id=None):
         'status_code': status_code,
         'ip': request.remote_addr
     }
-    logger.info(json.dumps(log_data))
+    logger.info(log_data)
 
-def setup_request_logging(app):
-    @app.before_request
-    def before_request():
-        pass
+def get_request_user_id():
+    """Identity of the caller, resolved at most once per request.
 
-    @app.after_request
-    def after_request(response):
-        user_id = None
+    Reuses the token already verified by @jwt_required when there is one and only
+    decodes it here for routes without the decorator that still received credentials.
+    """
+    if 'request_user_id' not in g:
+        g.request_user_id = None
         try:
-            verify_jwt_in_request(optional=True)
             jwt_identity = get_jwt_identity()
-            if jwt_identity:
-                user_id = int(jwt_identity)
-        except:
-            pass
-        log_request(response.status_code, user_id)
+        except RuntimeError:
+            # Not verified by @jwt_required on this request
+            jwt_identity = None
+            if 'Authorization' in request.headers or request.cookies:
+                try:
+                    verify_jwt_in_request(optional=True)
+                    jwt_identity = get_jwt_identity()
+                except Exception:
+                    pass
+        if jwt_identity:
+            g.request_user_id = int(jwt_identity)
+    return g.request_user_id
+
+def setup_request_logging(app):
+    @app.after_request
+    def after_request(response):
+        if should_log_request(response.status_code):
+            log_request(response.status_code, get_request_user_id())
         return response
 
 def setup_error_handler(app):
@@ -50,8 +173,9 @@ def setup_error_handler(app):
             'error': str(e),
             'method': request.method,
             'endpoint': request.endpoint,
-            'url': request.url
+            'url': request.url,
+            'user_id': get_request_user_id()
         }
-        logger.error(json.dumps(error_data))
+        logger.error(error_data)
         from flask import jsonify
-        return jsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
+        return jsonify({'error': 'Internal server error'}), 500
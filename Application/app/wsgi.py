@@ -0,0 +1,6 @@
+"""WSGI entry point for production servers: gunicorn -c gunicorn.conf.py wsgi:app
+
+Importing this module only builds the app. Schema setup runs once in the gunicorn
+master (see gunicorn.conf.py) instead of in every worker.
+"""
+from app import app
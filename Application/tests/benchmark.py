@@ -0,0 +1,583 @@
+import argparse
+import http.client
+import io
+import json
+import logging
+import multiprocessing
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'app'))
+sys.path.append(APP_DIR)
+
+# Benchmarks run against DATABASE_URL when set, otherwise a throwaway SQLite file
+os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'quiz_benchmark.db'))
+os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-secret-key-for-local-runs-only')
+
+from flask_jwt_extended import create_access_token, get_jwt_identity, verify_jwt_in_request
+from sqlalchemy import text
+from flask.json.provider import DefaultJSONProvider
+from app import app, initialize_database
+from models import db, User, Quiz, Question, Answer
+from passwords import PasswordHasher
+from responses import FastJSONProvider, brotli, compress, orjson
+from routes import quiz_catalog_query, serialize_catalog_quiz
+from search import rebuild_search_index
+from utils import get_request_user_id, log_request, logger
+
+
+def timed(func, repeat):
+    """Run func `repeat` times and return the median duration in milliseconds"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def insert_in_chunks(table, rows, chunk_size=50000):
+    for start in range(0, len(rows), chunk_size):
+        db.session.execute(table.insert(), rows[start:start + chunk_size])
+    db.session.commit()
+
+
+def seed_database(users, quizzes, questions_per_quiz, answers):
+    """Recreate the schema and fill it with synthetic data using executemany inserts"""
+    print(f"🌱 Seeding {users} users, {quizzes} quizzes, "
+          f"{quizzes * questions_per_quiz} questions and {answers} answers...")
+    db.drop_all()
+    db.create_all()
+
+    now = datetime.utcnow()
+    topics = ['Math', 'Science', 'History', 'Geography', 'Literature', 'General']
+
+    insert_in_chunks(User.__table__, [{
+        'id': i + 1,
+        'first_name': 'Bench',
+        'last_name': f'User{i}',
+        'email': f'bench{i}@example.com',
+        'password_hash': 'x',
+        'created_at': now
+    } for i in range(users)])
+
+    insert_in_chunks(Quiz.__table__, [{
+        'id': i + 1,
+        'title': f'Benchmark Quiz {i}',
+        'description': 'Synthetic quiz',
+        'topic': topics[i % len(topics)],
+        'creator_id': i % users + 1,
+        'created_at': now - timedelta(minutes=i)
+    } for i in range(quizzes)])
+
+    total_questions = quizzes * questions_per_quiz
+    insert_in_chunks(Question.__table__, [{
+        'id': i + 1,
+        'quiz_id': i // questions_per_quiz + 1,
+        'text': f'Question {i}?',
+        'option_a': 'A',
+        'option_b': 'B',
+        'option_c': 'C',
+        'option_d': 'D',
+        'correct_option': 'ABCD'[i % 4]
+    } for i in range(total_questions)])
+
+    if answers > users * total_questions:
+        raise SystemExit('Not enough (user, question) pairs for the requested number of answers')
+
+    # Every user answers consecutive questions, so (user_id, question_id) stays unique
+    rng = random.Random(42)
+    insert_in_chunks(Answer.__table__, [{
+        'user_id': i % users + 1,
+        'question_id': i // users % total_questions + 1,
+        'selected_option': 'ABCD'[rng.randrange(4)],
+        'is_correct': rng.random() < 0.6,
+        'answered_at': now
+    } for i in range(answers)])
+
+
+def drop_secondary_indexes():
+    with db.engine.connect() as conn:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(bind=conn, checkfirst=True)
+        conn.commit()
+
+
+def explain(sql, params):
+    if db.engine.dialect.name == 'postgresql':
+        rows = db.session.execute(text('EXPLAIN ' + sql), params).fetchall()
+        return [row[0] for row in rows]
+    rows = db.session.execute(text('EXPLAIN QUERY PLAN ' + sql), params).fetchall()
+    return [row[-1] for row in rows]
+
+
+def run_stats_queries(label, queries, repeat):
+    print(f"\n{'=' * 80}")
+    print(f"📊 {label}")
+    print(f"{'=' * 80}")
+    results = {}
+    for name, sql, params in queries:
+        plan = explain(sql, params)
+        results[name] = timed(lambda: db.session.execute(text(sql), params).fetchall(), repeat)
+        print(f"\n{name}: {results[name]:.3f} ms (median of {repeat})")
+        for line in plan:
+            print(f"    {line}")
+    return results
+
+
+def benchmark_indexes(args):
+    """Query plans and latencies of the hot stats queries before and after the secondary indexes"""
+    queries = [
+        ('answers_by_user',
+         'SELECT COUNT(*) FROM answer WHERE user_id = :user_id',
+         {'user_id': 7}),
+        ('correct_answers_by_user',
+         'SELECT COUNT(*) FROM answer WHERE user_id = :user_id AND is_correct',
+         {'user_id': 7}),
+        ('answers_by_question',
+         'SELECT COUNT(*) FROM answer WHERE question_id = :question_id',
+         {'question_id': 42}),
+        ('quiz_score',
+         'SELECT COUNT(*) FROM answer JOIN question ON question.id = answer.question_id '
+         'WHERE answer.user_id = :user_id AND question.quiz_id = :quiz_id AND answer.is_correct',
+         {'user_id': 7, 'quiz_id': 3}),
+        ('questions_by_quiz',
+         'SELECT COUNT(*) FROM question WHERE quiz_id = :quiz_id',
+         {'quiz_id': 3}),
+        ('quizzes_by_creator',
+         'SELECT COUNT(*) FROM quiz WHERE creator_id = :user_id',
+         {'user_id': 7}),
+        ('catalog_page_by_topic',
+         'SELECT id FROM quiz WHERE topic = :topic ORDER BY created_at DESC, id DESC LIMIT 20',
+         {'topic': 'Science'}),
+    ]
+
+    with app.app_context():
+        seed_database(args.users, args.quizzes, args.questions_per_quiz, args.answers)
+
+        drop_secondary_indexes()
+        db.session.execute(text('ANALYZE'))
+        before = run_stats_queries('Before: primary keys only', queries, args.repeat)
+
+        print("\n🔧 Creating indexes through initialize_database()...")
+        initialize_database()
+        db.session.execute(text('ANALYZE'))
+        after = run_stats_queries('After: secondary indexes', queries, args.repeat)
+
+    print(f"\n{'=' * 80}")
+    print(f"{'query':<28}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>12}")
+    print(f"{'-' * 80}")
+    for name, _, _ in queries:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:<28}{before[name]:>14.3f}{after[name]:>14.3f}{speedup:>11.1f}x")
+    print(f"{'=' * 80}\n")
+
+
+def legacy_request_user_id():
+    """The identity lookup the logging hook used to run on every response"""
+    user_id = None
+    try:
+        verify_jwt_in_request(optional=True)
+        jwt_identity = get_jwt_identity()
+        if jwt_identity:
+            user_id = int(jwt_identity)
+    except Exception:
+        pass
+    return user_id
+
+
+def time_logging_hook(identity, path, headers, verified_by_route, iterations):
+    """Mean microseconds spent in the after_request logging hook for one request"""
+    total = 0.0
+    for _ in range(iterations):
+        with app.test_request_context(path, headers=headers):
+            if verified_by_route:
+                # What @jwt_required already did before the hook runs
+                verify_jwt_in_request()
+            start = time.perf_counter()
+            log_request(200, identity())
+            total += time.perf_counter() - start
+    return total / iterations * 1e6
+
+
+def benchmark_logging(args):
+    """Per-request overhead of the logging middleware before and after the request-scoped identity"""
+    with app.app_context():
+        token = create_access_token(identity='1')
+    auth = {'Authorization': f'Bearer {token}'}
+
+    scenarios = [
+        ('static asset, no token', '/static/css/styles.css', {}, False),
+        ('template page, no token', '/dashboard', {}, False),
+        ('public API route, with token', '/quiz', auth, False),
+        ('@jwt_required API route', '/user/stats', auth, True),
+    ]
+
+    # Keep the JSON encoding in the measurement but not the stream write
+    logger.setLevel(logging.CRITICAL)
+
+    print(f"\n{'=' * 80}")
+    print(f"{'scenario':<34}{'before (us)':>14}{'after (us)':>14}{'speedup':>12}")
+    print(f"{'-' * 80}")
+    for name, path, headers, verified_by_route in scenarios:
+        before = time_logging_hook(legacy_request_user_id, path, headers, verified_by_route, args.iterations)
+        after = time_logging_hook(get_request_user_id, path, headers, verified_by_route, args.iterations)
+        print(f"{name:<34}{before:>14.2f}{after:>14.2f}{before / after:>11.1f}x")
+    print(f"{'=' * 80}\n")
+
+
+def benchmark_serialization(args):
+    """Encoding time and response bytes of the full catalog (GET /quiz?all=true)"""
+    with app.app_context():
+        seed_database(100, args.quizzes, 5, 0)
+        catalog = [serialize_catalog_quiz(q, question_count) for q, question_count in quiz_catalog_query().all()]
+
+    providers = [('json (stdlib)', DefaultJSONProvider(app))]
+    if orjson is not None:
+        providers.append(('orjson', FastJSONProvider(app)))
+
+    print(f"\n{'=' * 80}")
+    print(f"Serializing {len(catalog)} quizzes (median of {args.repeat})")
+    print(f"{'encoder':<24}{'time (ms)':>14}{'bytes':>14}")
+    print(f"{'-' * 80}")
+    body = None
+    for name, provider in providers:
+        duration = timed(lambda: provider.dumps(catalog, separators=(',', ':')), args.repeat)
+        body = provider.dumps(catalog, separators=(',', ':')).encode()
+        print(f"{name:<24}{duration:>14.3f}{len(body):>14}")
+
+    encodings = [('identity', None), ('gzip', 'gzip')]
+    if brotli is not None:
+        encodings.append(('br', 'br'))
+
+    print(f"\n{'encoding':<24}{'time (ms)':>14}{'bytes':>14}{'ratio':>12}")
+    print(f"{'-' * 80}")
+    for name, encoding in encodings:
+        if encoding is None:
+            duration, size = 0.0, len(body)
+        else:
+            duration = timed(lambda: compress(body, encoding, app.config), args.repeat)
+            size = len(compress(body, encoding, app.config))
+        print(f"{name:<24}{duration:>14.3f}{size:>14}{len(body) / size:>11.1f}x")
+    print(f"{'=' * 80}\n")
+
+
+def client_loop(port, paths, deadline, counts):
+    """One load-generating process: keep-alive GETs round-robin over paths until deadline"""
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    done = errors = 0
+    while time.time() < deadline:
+        try:
+            conn.request('GET', paths[done % len(paths)])
+            response = conn.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors += 1
+            done += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port)
+    counts.put((done, errors))
+
+
+def wait_until_ready(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/health')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit('gunicorn did not become ready')
+
+
+def benchmark_workers(args):
+    """Requests/sec through gunicorn (wsgi:app) at increasing worker counts"""
+    with app.app_context():
+        seed_database(50, args.quizzes, 10, 0)
+        initialize_database()
+
+    paths = ['/quiz', '/quiz?limit=50', '/health'] + [f'/quiz/{i}' for i in range(1, 21)]
+    results = []
+    for workers in args.workers:
+        env = dict(os.environ, GUNICORN_WORKERS=str(workers), GUNICORN_THREADS=str(args.threads),
+                   GUNICORN_BIND=f'127.0.0.1:{args.port}', LOG_SUCCESS_SAMPLE_RATE='0')
+        env.pop('PROMETHEUS_MULTIPROC_DIR', None)
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+            cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_until_ready(args.port)
+            counts = multiprocessing.Queue()
+            deadline = time.time() + args.duration
+            clients = [multiprocessing.Process(target=client_loop, args=(args.port, paths, deadline, counts))
+                       for _ in range(args.clients)]
+            for client in clients:
+                client.start()
+            totals = [counts.get() for _ in clients]
+            for client in clients:
+                client.join()
+        finally:
+            server.terminate()
+            server.wait()
+        done = sum(count for count, _ in totals)
+        errors = sum(error for _, error in totals)
+        results.append((workers, done / args.duration, errors))
+
+    print(f"\n{'=' * 80}")
+    print(f"{args.clients} clients, {args.threads} threads per worker, {args.duration}s per run")
+    print(f"{'workers':<12}{'req/s':>14}{'errors':>12}{'scaling':>12}")
+    print(f"{'-' * 80}")
+    for workers, rate, errors in results:
+        print(f"{workers:<12}{rate:>14.1f}{errors:>12}{rate / results[0][1]:>11.2f}x")
+    print(f"{'=' * 80}\n")
+
+
+def benchmark_passwords(args):
+    """Login password checks/sec, and per core, for hash methods and hashing pool sizes"""
+    cores = os.cpu_count() or 1
+    results = []
+    for method in args.methods:
+        for workers in args.workers:
+            hasher = PasswordHasher(method, workers=workers, max_pending=args.clients)
+            password_hash = hasher.hash('correct horse battery staple')
+            done = [0] * args.clients
+            deadline = time.perf_counter() + args.duration
+
+            def login_loop(n):
+                while time.perf_counter() < deadline:
+                    hasher.verify(password_hash, 'correct horse battery staple')
+                    done[n] += 1
+
+            clients = [threading.Thread(target=login_loop, args=(n,)) for n in range(args.clients)]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            if hasher.executor is not None:
+                hasher.executor.shutdown()
+            rate = sum(done) / args.duration
+            results.append((hasher.method, workers, rate, rate / min(max(workers, 1), cores)))
+
+    print(f"\n{'=' * 80}")
+    print(f"{args.clients} concurrent logins, {args.duration}s per run, {cores} CPU(s); workers=0 hashes inline")
+    print(f"{'method':<28}{'workers':>10}{'logins/s':>14}{'per core':>14}")
+    print(f"{'-' * 80}")
+    for method, workers, rate, per_core in results:
+        print(f"{method:<28}{workers:>10}{rate:>14.1f}{per_core:>14.1f}")
+    print(f"{'=' * 80}\n")
+
+
+SEARCH_VOCABULARY = (
+    'algebra geometry calculus statistics physics chemistry biology astronomy geology ecology '
+    'ancient medieval modern empire revolution treaty dynasty river mountain desert ocean island '
+    'capital novel poetry drama author grammar vocabulary music painting sculpture football '
+    'olympics cinema television computer network database algorithm language culture economy'
+).split()
+
+
+def benchmark_search(args):
+    """Latency of GET /quiz/search against filtering the full catalog (GET /quiz?all=true)"""
+    rng = random.Random(7)
+    with app.app_context():
+        seed_database(1000, args.quizzes, args.questions_per_quiz, 0)
+        # Give every quiz a distinct mix of words to search for
+        db.session.execute(text('UPDATE quiz SET title = :title, description = :description WHERE id = :id'), [{
+            'id': i + 1,
+            'title': ' '.join(rng.sample(SEARCH_VOCABULARY, 3)).capitalize(),
+            'description': ' '.join(rng.sample(SEARCH_VOCABULARY, 8))
+        } for i in range(args.quizzes)])
+        db.session.commit()
+        start = time.perf_counter()
+        rebuild_search_index()
+        db.session.commit()
+        print(f"Indexed {args.quizzes} quizzes in {time.perf_counter() - start:.1f}s")
+
+    logger.setLevel(logging.WARNING)
+    client = app.test_client()
+    queries = ['geology', 'treaty dynasty', 'astro', 'ancient empire revolution', 'question']
+
+    def legacy_search(query):
+        # What browse_quizzes.html did: download everything, then substring-match
+        quizzes = client.get('/quiz?all=true').get_json()
+        return [q for q in quizzes if query in q['title'].lower() or query in q['description'].lower()]
+
+    print(f"\n{'=' * 80}")
+    print(f"Searching {args.quizzes} quizzes (median of {args.repeat})")
+    print(f"{'query':<30}{'search (ms)':>14}{'page':>8}{'all=true (ms)':>16}{'matches':>10}")
+    print(f"{'-' * 80}")
+    for query in queries:
+        url = f'/quiz/search?limit=20&q={query}'
+        duration = timed(lambda: client.get(url), args.repeat)
+        page = len(client.get(url).get_json()['quizzes'])
+        legacy = timed(lambda: legacy_search(query), max(1, args.repeat // 5))
+        print(f"{query:<30}{duration:>14.2f}{page:>8}{legacy:>16.1f}{len(legacy_search(query)):>10}")
+    print(f"{'=' * 80}\n")
+
+
+def benchmark_export(args):
+    """Time to first byte, total time and peak memory of streaming a quiz's answers"""
+    with app.app_context():
+        # One quiz, so that every answer belongs to the exported quiz
+        seed_database(args.users, 1, args.answers // args.users, args.answers)
+        token = create_access_token(identity='1')
+    logger.setLevel(logging.WARNING)
+    client = app.test_client()
+    auth = {'Authorization': f'Bearer {token}'}
+
+    def stream(export_format):
+        start = time.perf_counter()
+        response = client.get(f'/quiz/1/answers/export?format={export_format}', headers=auth, buffered=False)
+        first_byte = None
+        size = 0
+        for chunk in response.response:
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+        response.close()
+        return first_byte, size
+
+    def materialize():
+        # The /debug/answers approach: every row as an ORM object, then one JSON body
+        start = time.perf_counter()
+        with app.app_context():
+            answers = Answer.query.join(Question).filter(Question.quiz_id == 1).all()
+            body = app.json.dumps([{
+                'id': a.id, 'user_id': a.user_id, 'question_id': a.question_id,
+                'selected_option': a.selected_option, 'is_correct': a.is_correct,
+                'answered_at': a.answered_at.isoformat()
+            } for a in answers])
+        return time.perf_counter() - start, len(body)
+
+    print(f"\n{'=' * 80}")
+    print(f"Exporting {args.answers} answers of one quiz")
+    print(f"{'method':<24}{'first byte (ms)':>18}{'total (s)':>12}{'MB sent':>10}{'peak MB':>10}")
+    print(f"{'-' * 80}")
+    runs = [(f'stream {f}', lambda f=f: stream(f)) for f in ('csv', 'ndjson')] + [('materialized json', None)]
+    for name, run in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        if run is None:
+            first_byte, size = materialize()
+        else:
+            first_byte, size = run()
+        total = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<24}{first_byte * 1000:>18.1f}{total:>12.2f}{size / 1e6:>10.1f}{peak / 1e6:>10.1f}")
+    print(f"{'=' * 80}\n")
+
+
+def benchmark_import(args):
+    """Time and peak memory of importing a question bank through questions:import and questions:bulk"""
+    with app.app_context():
+        seed_database(1, 1, 0, 0)
+        token = create_access_token(identity='1')
+    logger.setLevel(logging.WARNING)
+    client = app.test_client()
+    auth = {'Authorization': f'Bearer {token}'}
+
+    questions = [{'text': f'Imported question {i}?', 'option_a': 'Alpha', 'option_b': 'Beta',
+                  'option_c': 'Gamma', 'option_d': 'Delta', 'correct_option': 'ABCD'[i % 4]}
+                 for i in range(args.questions)]
+    csv_body = ('text,option_a,option_b,option_c,option_d,correct_option\n' + ''.join(
+        f"{q['text']},{q['option_a']},{q['option_b']},{q['option_c']},{q['option_d']},{q['correct_option']}\n"
+        for q in questions
+    )).encode()
+    json_body = app.json.dumps({'questions': questions}).encode()
+    del questions
+
+    runs = [
+        ('import csv', '/quiz/1/questions:import', csv_body, 'text/csv'),
+        ('import json', '/quiz/1/questions:import', json_body, 'application/json'),
+        # The bulk endpoint parses the whole body at once and caps the question count
+        ('bulk json (first 1000)', '/quiz/1/questions:bulk',
+         app.json.dumps({'questions': json.loads(json_body)['questions'][:1000]}).encode(), 'application/json'),
+    ]
+    print(f"\n{'=' * 80}")
+    print(f"Importing {args.questions} questions ({len(json_body) / 1e6:.1f} MB as JSON)")
+    print(f"{'method':<26}{'status':>8}{'created':>10}{'time (s)':>12}{'peak MB':>10}")
+    print(f"{'-' * 80}")
+    for name, url, body, content_type in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        response = client.post(url, data=io.BytesIO(body), content_type=content_type, headers=auth)
+        duration = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        created = (response.get_json() or {}).get('created', 0)
+        print(f"{name:<26}{response.status_code:>8}{created:>10}{duration:>12.2f}{peak / 1e6:>10.1f}")
+    print(f"{'=' * 80}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Quiz application performance benchmarks')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    indexes = subparsers.add_parser('indexes', help=benchmark_indexes.__doc__)
+    indexes.add_argument('--users', type=int, default=1000)
+    indexes.add_argument('--quizzes', type=int, default=5000)
+    indexes.add_argument('--questions-per-quiz', type=int, default=10)
+    indexes.add_argument('--answers', type=int, default=1000000)
+    indexes.add_argument('--repeat', type=int, default=20)
+    indexes.set_defaults(func=benchmark_indexes)
+
+    logging_overhead = subparsers.add_parser('logging', help=benchmark_logging.__doc__)
+    logging_overhead.add_argument('--iterations', type=int, default=5000)
+    logging_overhead.set_defaults(func=benchmark_logging)
+
+    serialization = subparsers.add_parser('serialization', help=benchmark_serialization.__doc__)
+    serialization.add_argument('--quizzes', type=int, default=10000)
+    serialization.add_argument('--repeat', type=int, default=20)
+    serialization.set_defaults(func=benchmark_serialization)
+
+    workers = subparsers.add_parser('workers', help=benchmark_workers.__doc__)
+    workers.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    workers.add_argument('--threads', type=int, default=4)
+    workers.add_argument('--clients', type=int, default=16)
+    workers.add_argument('--duration', type=float, default=10)
+    workers.add_argument('--quizzes', type=int, default=500)
+    workers.add_argument('--port', type=int, default=5055)
+    workers.set_defaults(func=benchmark_workers)
+
+    search = subparsers.add_parser('search', help=benchmark_search.__doc__)
+    search.add_argument('--quizzes', type=int, default=100000)
+    search.add_argument('--questions-per-quiz', type=int, default=5)
+    search.add_argument('--repeat', type=int, default=20)
+    search.set_defaults(func=benchmark_search)
+
+    export = subparsers.add_parser('export', help=benchmark_export.__doc__)
+    export.add_argument('--users', type=int, default=1000)
+    export.add_argument('--answers', type=int, default=1000000)
+    export.set_defaults(func=benchmark_export)
+
+    question_import = subparsers.add_parser('import', help=benchmark_import.__doc__)
+    question_import.add_argument('--questions', type=int, default=10000)
+    question_import.set_defaults(func=benchmark_import)
+
+    passwords = subparsers.add_parser('passwords', help=benchmark_passwords.__doc__)
+    passwords.add_argument('--methods', nargs='+', default=['scrypt:32768:8:1', 'scrypt:16384:8:1', 'pbkdf2:sha256:600000'])
+    passwords.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2])
+    passwords.add_argument('--clients', type=int, default=8)
+    passwords.add_argument('--duration', type=float, default=5)
+    passwords.set_defaults(func=benchmark_passwords)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
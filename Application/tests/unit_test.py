@@ -59,6 +59,8 @@ class FullAppTest(unittest.TestCase):
         app.config['TESTING'] = True
         app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
         app.config['JWT_SECRET_KEY'] = 'test-secret'
+        app.config['METRICS_REFRESH_SECONDS'] = 0
+        app.extensions['quiz_cache'].clear()
         self.client = app.test_client()
 
         with app.app_context():
@@ -82,6 +84,37 @@ class FullAppTest(unittest.TestCase):
             db.session.remove()
             db.drop_all()
 
+    def count_queries(self, func):
+        from sqlalchemy import event
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            result = func()
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+        return len(statements), result
+
+    def create_quiz_with_questions(self, correct_options):
+        with app.app_context():
+            quiz = Quiz(title='Quiz for batch answers', creator_id=self.user_id)
+            quiz.questions = [Question(
+                text=f'Question {i}?',
+                option_a='A',
+                option_b='B',
+                option_c='C',
+                option_d='D',
+                correct_option=option
+            ) for i, option in enumerate(correct_options)]
+            db.session.add(quiz)
+            db.session.commit()
+            return quiz.id, [q.id for q in quiz.questions]
+
     # ============================================================================
     # 🔐 AUTHENTICATION & AUTHORIZATION TESTS
     # ============================================================================
@@ -116,6 +149,24 @@ class FullAppTest(unittest.TestCase):
         data = res.get_json()
         self.assertEqual(data['title'], 'Math Quiz')
 
+    def test_create_quiz_with_questions(self):
+        res = self.client.post('/quiz', json={
+            'title': 'Quiz with questions',
+            'questions': [{
+                'text': f'Question {i}?',
+                'option_a': 'A',
+                'option_b': 'B',
+                'option_c': 'C',
+                'option_d': 'D',
+                'correct_option': 'D'
+            } for i in range(3)]
+        }, headers=self.auth_header)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.get_json()['question_count'], 3)
+
+        res = self.client.get(f"/quiz/{res.get_json()['id']}", headers=self.auth_header)
+        self.assertEqual(len(res.get_json()['questions']), 3)
+
     def test_get_quizzes(self):
         # יצירת חידון ישירות בבסיס הנתונים
         with app.app_context():
@@ -125,8 +176,176 @@ class FullAppTest(unittest.TestCase):
 
         res = self.client.get('/quiz')
         self.assertEqual(res.status_code, 200)
+        self.assertGreaterEqual(len(res.get_json()['quizzes']), 1)
+
+        res = self.client.get('/quiz?all=true')
+        self.assertEqual(res.status_code, 200)
         self.assertGreaterEqual(len(res.get_json()), 1)
 
+    def test_get_quizzes_paginated(self):
+        with app.app_context():
+            for i in range(5):
+                db.session.add(Quiz(title=f'Paged Quiz {i}', topic='Math' if i % 2 else 'History', creator_id=self.user_id))
+            db.session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            url = '/quiz?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, 200)
+            data = res.get_json()
+            self.assertLessEqual(len(data['quizzes']), 2)
+            seen.extend(q['id'] for q in data['quizzes'])
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(seen, sorted(seen, reverse=True))
+
+    def test_get_quizzes_filtered(self):
+        with app.app_context():
+            other_user = User(
+                first_name='Other',
+                last_name='Creator',
+                email='creator@example.com',
+                password_hash=generate_password_hash('password')
+            )
+            db.session.add(other_user)
+            db.session.commit()
+            db.session.add(Quiz(title='Mine', topic='Math', creator_id=self.user_id))
+            db.session.add(Quiz(title='Mine too', topic='History', creator_id=self.user_id))
+            db.session.add(Quiz(title='Theirs', topic='Math', creator_id=other_user.id))
+            db.session.commit()
+
+        res = self.client.get(f'/quiz?creator_id={self.user_id}')
+        self.assertEqual({q['title'] for q in res.get_json()['quizzes']}, {'Mine', 'Mine too'})
+
+        res = self.client.get('/quiz?topic=Math')
+        self.assertEqual({q['title'] for q in res.get_json()['quizzes']}, {'Mine', 'Theirs'})
+
+    def test_get_quizzes_invalid_pagination(self):
+        self.assertEqual(self.client.get('/quiz?cursor=not-a-cursor').status_code, 400)
+        for creator_id in ('abc', '%C2%B2'):
+            self.assertEqual(self.client.get(f'/quiz?creator_id={creator_id}').status_code, 400)
+        self.assertEqual(self.client.get('/quiz?limit=abc').status_code, 400)
+        self.assertEqual(self.client.get('/quiz?limit=1000').get_json()['limit'], 100)
+
+    def test_get_quizzes_constant_query_count(self):
+        def seed_quizzes(count):
+            with app.app_context():
+                for i in range(count):
+                    quiz = Quiz(title=f'Catalog Quiz {i}', topic='General', creator_id=self.user_id)
+                    quiz.questions = [Question(
+                        text=f'Question {j}?',
+                        option_a='A',
+                        option_b='B',
+                        option_c='C',
+                        option_d='D',
+                        correct_option='A'
+                    ) for j in range(3)]
+                    db.session.add(quiz)
+                db.session.commit()
+
+        seed_quizzes(2)
+        small_count, res = self.count_queries(lambda: self.client.get('/quiz?all=true'))
+        self.assertEqual(len(res.get_json()), 2)
+
+        seed_quizzes(50)
+        large_count, res = self.count_queries(lambda: self.client.get('/quiz?all=true'))
+        data = res.get_json()
+        self.assertEqual(len(data), 52)
+        self.assertEqual(small_count, large_count)
+        self.assertTrue(all(q['question_count'] == 3 for q in data))
+        self.assertTrue(all(q['creator_name'] == 'Test User' for q in data))
+
+    def test_search_quizzes(self):
+        def create(title, topic='General', description='', questions=()):
+            res = self.client.post('/quiz', json={
+                'title': title, 'topic': topic, 'description': description,
+                'questions': [{'text': text, 'option_a': 'A', 'option_b': 'B', 'option_c': 'C',
+                               'option_d': 'D', 'correct_option': 'A'} for text in questions]
+            }, headers=self.auth_header)
+            return res.get_json()['id']
+
+        def search(query, **params):
+            res = self.client.get('/quiz/search', query_string=dict(params, q=query))
+            self.assertEqual(res.status_code, 200)
+            return res.get_json()
+
+        def titles(query):
+            return [q['title'] for q in search(query)['quizzes']]
+
+        algebra = create('Algebra basics', topic='Math', questions=['Solve for x'])
+        create('Planets', topic='Science', questions=['Which planet has rings? Saturn or algebra'])
+        history_id = create('World wars', topic='History', description='Treaties and battles')
+
+        # Title matches outrank question text, terms match word prefixes and stems
+        self.assertEqual(titles('algebra'), ['Algebra basics', 'Planets'])
+        self.assertEqual(titles('alg'), ['Algebra basics', 'Planets'])
+        self.assertEqual(titles('saturn ring'), ['Planets'])
+        self.assertEqual(titles('treaty'), ['World wars'])
+        self.assertEqual(titles('science'), ['Planets'])
+        self.assertEqual(titles('algebra" NOT planets*'), [])
+
+        page = search('algebra', limit=1)
+        self.assertEqual(page['next_offset'], 1)
+        page = search('algebra', limit=1, offset=1)
+        self.assertEqual([q['title'] for q in page['quizzes']], ['Planets'])
+        self.assertIsNone(page['next_offset'])
+
+        # Every write refreshes the index
+        self.client.put(f'/quiz/{history_id}', json={'title': 'Ancient empires'}, headers=self.auth_header)
+        self.assertEqual(titles('wars'), [])
+        self.assertEqual(titles('empire'), ['Ancient empires'])
+        self.client.post(f'/quiz/{history_id}/question', json={
+            'text': 'Who built Rome?', 'option_a': 'A', 'option_b': 'B', 'option_c': 'C',
+            'option_d': 'D', 'correct_option': 'A'
+        }, headers=self.auth_header)
+        self.assertEqual(titles('rome'), ['Ancient empires'])
+        self.client.delete(f'/quiz/{algebra}', headers=self.auth_header)
+        self.assertEqual(titles('algebra'), ['Planets'])
+
+        self.assertEqual(self.client.get('/quiz/search?q=%20!').status_code, 400)
+        self.assertEqual(self.client.get('/quiz/search?q=a&offset=-1').status_code, 400)
+
+    def test_topic_facets(self):
+        from app import initialize_database
+        from models import TopicCount
+
+        quiz_ids = [self.client.post('/quiz', json={'title': f'Quiz {i}', 'topic': topic}, headers=self.auth_header)
+                    .get_json()['id'] for i, topic in enumerate(['Math', 'Math', 'History', 'Science'])]
+        self.client.put(f'/quiz/{quiz_ids[3]}', json={'topic': 'History'}, headers=self.auth_header)
+        self.client.delete(f'/quiz/{quiz_ids[0]}', headers=self.auth_header)
+
+        expected = [{'topic': 'History', 'quiz_count': 2}, {'topic': 'Math', 'quiz_count': 1}]
+        count, res = self.count_queries(lambda: self.client.get('/quiz/topics'))
+        self.assertEqual(res.get_json()['topics'], expected)
+        self.assertEqual(count, 1)
+        self.assertTrue(res.cache_control.public)
+        self.assertEqual(self.client.get('/quiz/topics', headers={'If-None-Match': res.headers['ETag']}).status_code, 304)
+
+        # Databases that predate the counter table are counted on startup
+        with app.app_context():
+            db.session.query(TopicCount).delete()
+            db.session.commit()
+        initialize_database()
+        self.assertEqual(self.client.get('/quiz/topics').get_json()['topics'], expected)
+
+    def test_initialize_database_builds_search_index(self):
+        from app import initialize_database
+
+        with app.app_context():
+            db.session.add(Quiz(title='Imported geology quiz', creator_id=self.user_id))
+            db.session.commit()
+        self.assertEqual(self.client.get('/quiz/search?q=geology').get_json()['quizzes'], [])
+
+        initialize_database()
+
+        quizzes = self.client.get('/quiz/search?q=geology').get_json()['quizzes']
+        self.assertEqual([q['title'] for q in quizzes], ['Imported geology quiz'])
+
     # --- Questions ---
     def test_add_question(self):
         with app.app_context():
@@ -147,6 +366,165 @@ class FullAppTest(unittest.TestCase):
         self.assertEqual(res.status_code, 201)
         self.assertEqual(res.get_json()['correct_option'], 'B')
 
+    def test_add_questions_bulk(self):
+        with app.app_context():
+            quiz = Quiz(title='Quiz for bulk import', creator_id=self.user_id)
+            db.session.add(quiz)
+            db.session.commit()
+            quiz_id = quiz.id
+
+        questions = [{
+            'text': f'Bulk question {i}?',
+            'option_a': 'A',
+            'option_b': 'B',
+            'option_c': 'C',
+            'option_d': 'D',
+            'correct_option': 'C'
+        } for i in range(25)]
+
+        res = self.client.post(f'/quiz/{quiz_id}/questions:bulk', json={'questions': questions}, headers=self.auth_header)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.get_json()['created'], 25)
+
+        with app.app_context():
+            self.assertEqual(Question.query.filter_by(quiz_id=quiz_id).count(), 25)
+
+    def test_add_questions_bulk_invalid_rows(self):
+        with app.app_context():
+            quiz = Quiz(title='Quiz for invalid bulk import', creator_id=self.user_id)
+            db.session.add(quiz)
+            db.session.commit()
+            quiz_id = quiz.id
+
+        questions = [
+            {'text': 'Valid?', 'option_a': 'A', 'option_b': 'B', 'option_c': 'C', 'option_d': 'D', 'correct_option': 'A'},
+            {'text': 'Missing options?', 'option_a': 'A'},
+            {'text': 'Bad option?', 'option_a': 'A', 'option_b': 'B', 'option_c': 'C', 'option_d': 'D', 'correct_option': 'Z'},
+            {'text': 'Long option?', 'option_a': 'A' * 501, 'option_b': 'B', 'option_c': 'C', 'option_d': 'D', 'correct_option': 'A'}
+        ]
+
+        res = self.client.post(f'/quiz/{quiz_id}/questions:bulk', json={'questions': questions}, headers=self.auth_header)
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual([e['index'] for e in res.get_json()['errors']], [1, 2, 3])
+
+        with app.app_context():
+            self.assertEqual(Question.query.filter_by(quiz_id=quiz_id).count(), 0)
+
+    def test_import_questions(self):
+        from unittest import mock
+        import imports
+
+        quiz_id, _ = self.create_quiz_with_questions([])
+        url = f'/quiz/{quiz_id}/questions:import'
+
+        def post(body, content_type, **params):
+            return self.client.post(url, data=body, content_type=content_type,
+                                    query_string=params, headers=self.auth_header)
+
+        def imported():
+            with app.app_context():
+                return [(q.text, q.option_b, q.correct_option)
+                        for q in Question.query.filter_by(quiz_id=quiz_id).order_by(Question.id)]
+
+        csv_body = ('﻿text,option_a,option_b,option_c,option_d,correct_option\n'
+                    '"Capital of France, again?",London,Paris,Rome,Madrid, b \n'
+                    'What is 2+2?,3,4,5,6,B\n').encode()
+        res = post(csv_body, 'text/csv')
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.get_json()['created'], 2)
+        self.assertEqual(imported(), [('Capital of France, again?', 'Paris', 'B'), ('What is 2+2?', '4', 'B')])
+
+        # JSON is decoded item by item across read chunks and inserted in batches
+        questions = [{'text': f'Question {i}?', 'option_a': 'A', 'option_b': 'B', 'option_c': 'C',
+                      'option_d': 'D', 'correct_option': 'C'} for i in range(7)]
+        with mock.patch.object(imports, 'READ_CHUNK_SIZE', 16), \
+                mock.patch('routes.IMPORT_BATCH_SIZE', 3):
+            res = post(json.dumps({'questions': questions}, indent=2), 'application/json')
+        self.assertEqual(res.get_json()['created'], 7)
+        self.assertEqual(len(imported()), 9)
+
+        # One bad row rolls back the batches already inserted
+        with mock.patch('routes.IMPORT_BATCH_SIZE', 2):
+            res = post(json.dumps(questions[:5] + [{'text': 'Incomplete?'}] + questions), 'application/json')
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.get_json()['errors'], [{'index': 5, 'error': 'All question fields required'}])
+        self.assertEqual(len(imported()), 9)
+
+        # Numbers become text; lists, objects and booleans are rejected per row
+        numeric = dict(questions[0], option_a=3, option_b=4.0)
+        res = post(json.dumps([numeric, dict(questions[0], text=['a', 'list']), dict(questions[0], option_c={'x': 1}),
+                               dict(questions[0], option_d=True)]), 'application/json')
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.get_json()['errors'], [
+            {'index': i, 'error': 'Question fields must be text'} for i in (1, 2, 3)
+        ])
+
+        # Column lengths are checked per row instead of failing the batch INSERT
+        res = post(json.dumps([questions[0], dict(questions[0], option_b='x' * 501)]), 'application/json')
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.get_json()['errors'], [{'index': 1, 'error': 'option_b must be at most 500 characters'}])
+        self.assertEqual(len(imported()), 9)
+
+        self.assertEqual(post('[{"text": "Unterminated"', 'application/json').status_code, 400)
+        item = json.dumps(questions[0])
+        for body in (f'[{item} {item}]', f'[,{item}]', f'[{item},]', f'[{item},,{item}]', f'[{item}] x',
+                     f'{{"questions": [{item}]', f'{{"questions": [{item}], "extra": 1}}', f'[{item}]]'):
+            res = post(body, 'application/json')
+            self.assertEqual(res.status_code, 400, body)
+            self.assertIn('Invalid JSON', res.get_json()['error'])
+        with mock.patch.object(imports, 'READ_CHUNK_SIZE', 7):
+            res = post(f' {{ "questions" : [ {item} ,\n{item} ] }} \n', 'application/json')
+        self.assertEqual(res.get_json()['created'], 2)
+        # Top-level numbers cut right after a digit, "." or "e" are read to the end
+        for body in ('[15000000000.0,2e+10]', '[-1.5E3 ,true]'):
+            for size in range(1, len(body)):
+                with mock.patch.object(imports, 'READ_CHUNK_SIZE', size):
+                    res = post(body, 'application/json')
+                self.assertEqual(res.get_json()['errors'], [
+                    {'index': i, 'error': 'All question fields required'} for i in (0, 1)
+                ], (body, size))
+        self.assertEqual(post('{"title": "not questions"}', 'application/json').status_code, 400)
+        self.assertEqual(post('text,option_a\n', 'text/csv').status_code, 400)
+        self.assertEqual(post('<questions/>', 'application/xml').status_code, 415)
+        with app.app_context():
+            other = User(first_name='Other', last_name='User', email='other-importer@example.com', password_hash='x')
+            db.session.add(other)
+            db.session.commit()
+            other_header = {'Authorization': f'Bearer {create_access_token(identity=str(other.id))}'}
+        res = self.client.post(url, data=csv_body, content_type='text/csv', headers=other_header)
+        self.assertEqual(res.status_code, 403)
+
+    def test_import_questions_xlsx(self):
+        import io
+        import imports
+
+        if imports.openpyxl is None:
+            self.skipTest('openpyxl is not installed')
+        quiz_id, _ = self.create_quiz_with_questions([])
+        workbook = imports.openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_option'])
+        sheet.append(['What is 2+2?', 3, 4, 5, 6, 'b'])
+        sheet.append([None] * 6)
+        sheet.append(['Largest planet?', 'Mars', 'Jupiter', 'Venus', 'Earth', 'B'])
+        body = io.BytesIO()
+        workbook.save(body)
+
+        res = self.client.post(f'/quiz/{quiz_id}/questions:import', data=body.getvalue(),
+                               content_type=imports.XLSX_MIMETYPE, headers=self.auth_header)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.get_json()['created'], 2)
+        with app.app_context():
+            self.assertEqual([(q.option_b, q.correct_option) for q in Question.query.filter_by(quiz_id=quiz_id)],
+                             [('4', 'B'), ('Jupiter', 'B')])
+
+        # Workbooks are stored whole before parsing, so their size is capped
+        from unittest import mock
+        with mock.patch.object(imports, 'MAX_XLSX_SIZE', len(body.getvalue()) - 1):
+            res = self.client.post(f'/quiz/{quiz_id}/questions:import', data=body.getvalue(),
+                                   content_type=imports.XLSX_MIMETYPE, headers=self.auth_header)
+        self.assertEqual(res.status_code, 413)
+
     # ============================================================================
     # 📋 ANSWER SUBMISSION & SCORING TESTS
     # ============================================================================
@@ -177,6 +555,108 @@ class FullAppTest(unittest.TestCase):
         self.assertEqual(res.status_code, 200)
         self.assertTrue(res.get_json()['correct'])
 
+    def test_submit_answers_batch(self):
+        quiz_id, question_ids = self.create_quiz_with_questions(['A', 'B', 'C'])
+
+        res = self.client.post(f'/quiz/{quiz_id}/answers', json={'answers': [
+            {'question_id': question_ids[0], 'selected_option': 'A'},
+            {'question_id': question_ids[1], 'selected_option': 'B'},
+            {'question_id': question_ids[2], 'selected_option': 'D'}
+        ]}, headers=self.auth_header)
+        self.assertEqual(res.status_code, 200)
+        data = res.get_json()
+        self.assertEqual((data['score'], data['total']), (2, 3))
+
+        # Resubmitting updates the stored answers instead of duplicating them
+        res = self.client.post(f'/quiz/{quiz_id}/answers', json={'answers': [
+            {'question_id': question_ids[2], 'selected_option': 'C'}
+        ]}, headers=self.auth_header)
+        self.assertEqual(res.get_json()['score'], 3)
+
+        with app.app_context():
+            self.assertEqual(Answer.query.filter_by(user_id=self.user_id).count(), 3)
+
+        res = self.client.get(f'/quiz/{quiz_id}/score', headers=self.auth_header)
+        self.assertEqual(res.get_json()['score'], 3)
+
+        # A mix of new and changed answers only counts the new ones and the net change
+        new_quiz_id, new_question_ids = self.create_quiz_with_questions(['A', 'B'])
+        self.client.post(f'/quiz/{new_quiz_id}/answers', json={'answers': [
+            {'question_id': new_question_ids[0], 'selected_option': 'A'}
+        ]}, headers=self.auth_header)
+        res = self.client.post(f'/quiz/{new_quiz_id}/answers', json={'answers': [
+            {'question_id': new_question_ids[0], 'selected_option': 'C'},
+            {'question_id': new_question_ids[1], 'selected_option': 'B'}
+        ]}, headers=self.auth_header)
+        self.assertEqual(res.get_json()['score'], 1)
+        stats = self.client.get('/user/stats', headers=self.auth_header).get_json()
+        self.assertEqual((stats['quizzes_taken'], stats['total_answers']), (2, 5))
+        with app.app_context():
+            from scores import rebuild_score_aggregates
+            self.assertEqual(rebuild_score_aggregates(), 0)
+
+    def test_export_quiz_answers(self):
+        import csv
+        import io
+        from exports import quiz_answer_batches
+
+        quiz_id, question_ids = self.create_quiz_with_questions(['A', 'B', 'C'])
+        with app.app_context():
+            player = User(first_name='=SUM(1)', last_name='Player', email='player@example.com',
+                          password_hash=generate_password_hash('password'))
+            db.session.add(player)
+            db.session.commit()
+            player_id = player.id
+            player_header = {'Authorization': f'Bearer {create_access_token(identity=str(player_id))}'}
+        for question_id, option in zip(question_ids, 'ABD'):
+            self.client.post(f'/quiz/{quiz_id}/question/{question_id}/answer',
+                             json={'selected_option': option}, headers=player_header)
+
+        res = self.client.get(f'/quiz/{quiz_id}/answers/export', headers=self.auth_header)
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.is_streamed)
+        self.assertEqual(res.mimetype, 'text/csv')
+        self.assertIn(f'quiz-{quiz_id}-answers.csv', res.headers['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(res.get_data(as_text=True))))
+        self.assertEqual(sorted((int(r['question_id']), r['selected_option'], r['is_correct']) for r in rows),
+                         list(zip(question_ids, 'ABD', ['true', 'true', 'false'])))
+        self.assertEqual({r['first_name'] for r in rows}, {"'=SUM(1)"})
+
+        # One export at a time per worker; the slot is freed when the download is closed
+        busy = self.client.get(f'/quiz/{quiz_id}/answers/export', headers=self.auth_header)
+        self.assertEqual((busy.status_code, busy.headers['Retry-After']), (503, '5'))
+        res.close()
+
+        res = self.client.get(f'/quiz/{quiz_id}/answers/export?format=ndjson', headers=self.auth_header)
+        records = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+        res.close()
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(r['user_id'] == player_id and r['first_name'] == '=SUM(1)' for r in records))
+
+        from exports import csv_cell
+        self.assertEqual([csv_cell(v) for v in ('\tcmd', '\r=1', '-2', 'plain', True)],
+                         ["'\tcmd", "'\r=1", "'-2", 'plain', 'true'])
+
+        # Fetched in fixed-size batches
+        with app.app_context():
+            self.assertEqual([len(batch) for batch in quiz_answer_batches(quiz_id, batch_size=2)], [2, 1])
+
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}/answers/export', headers=player_header).status_code, 403)
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}/answers/export?format=xml',
+                                         headers=self.auth_header).status_code, 400)
+
+    def test_submit_answers_batch_invalid(self):
+        quiz_id, question_ids = self.create_quiz_with_questions(['A'])
+
+        res = self.client.post(f'/quiz/{quiz_id}/answers', json={'answers': [
+            {'question_id': question_ids[0], 'selected_option': 'X'},
+            {'question_id': 99999, 'selected_option': 'A'},
+            {'question_id': [question_ids[0]], 'selected_option': 'A'},
+            {'question_id': {'id': question_ids[0]}, 'selected_option': 'A'}
+        ]}, headers=self.auth_header)
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual([e['index'] for e in res.get_json()['errors']], [0, 1, 2, 3])
+
     # --- Score ---
     def test_get_score(self):
         with app.app_context():
@@ -208,6 +688,49 @@ class FullAppTest(unittest.TestCase):
         self.assertEqual(res.status_code, 200)
         self.assertIn('score', res.get_json())
 
+    def test_get_score_aggregates_consistent(self):
+        from scores import rebuild_score_aggregates
+
+        quiz_id, question_ids = self.create_quiz_with_questions(['A', 'B', 'C'])
+        other_quiz_id, other_question_ids = self.create_quiz_with_questions(['D'])
+
+        self.client.post(f'/quiz/{quiz_id}/answers', json={'answers': [
+            {'question_id': question_ids[0], 'selected_option': 'A'},
+            {'question_id': question_ids[1], 'selected_option': 'A'}
+        ]}, headers=self.auth_header)
+        self.client.post(f'/quiz/{quiz_id}/question/{question_ids[1]}/answer', json={
+            'selected_option': 'B'
+        }, headers=self.auth_header)
+        self.client.post(f'/quiz/{quiz_id}/question/{question_ids[2]}/answer', json={
+            'selected_option': 'D'
+        }, headers=self.auth_header)
+        self.client.post(f'/quiz/{other_quiz_id}/question/{other_question_ids[0]}/answer', json={
+            'selected_option': 'D'
+        }, headers=self.auth_header)
+
+        res = self.client.get(f'/quiz/{quiz_id}/score', headers=self.auth_header)
+        self.assertEqual(res.get_json(), {'score': 2, 'total': 3, 'percentage': 66.67})
+        self.assertEqual(self.client.get('/metrics').get_json()['total_answers'], 4)
+
+        res = self.client.delete(f'/question/{question_ids[0]}', headers=self.auth_header)
+        self.assertEqual(res.status_code, 200)
+        res = self.client.get(f'/quiz/{quiz_id}/score', headers=self.auth_header)
+        self.assertEqual(res.get_json()['score'], 1)
+
+        with app.app_context():
+            self.assertEqual(rebuild_score_aggregates(), 0)
+            db.session.rollback()
+
+        res = self.client.delete(f'/quiz/{quiz_id}', headers=self.auth_header)
+        self.assertEqual(res.status_code, 200)
+        stats = self.client.get('/user/stats', headers=self.auth_header).get_json()
+        self.assertEqual((stats['quizzes_taken'], stats['total_answers']), (1, 1))
+        self.assertEqual(self.client.get('/metrics').get_json()['average_score_percentage'], 100.0)
+
+        with app.app_context():
+            self.assertEqual(rebuild_score_aggregates(), 0)
+            db.session.rollback()
+
     # --- User profile ---
     def test_user_details(self):
         res = self.client.get(f'/user/{self.user_id}', headers=self.auth_header)
@@ -243,6 +766,29 @@ class FullAppTest(unittest.TestCase):
         self.assertIn('average_score_percentage', res.get_json())
 
 
+    def test_user_stats_single_query(self):
+        first_quiz, first_questions = self.create_quiz_with_questions(['A', 'B'])
+        second_quiz, second_questions = self.create_quiz_with_questions(['C'])
+
+        self.client.post(f'/quiz/{first_quiz}/answers', json={'answers': [
+            {'question_id': first_questions[0], 'selected_option': 'A'},
+            {'question_id': first_questions[1], 'selected_option': 'C'}
+        ]}, headers=self.auth_header)
+        self.client.post(f'/quiz/{second_quiz}/answers', json={'answers': [
+            {'question_id': second_questions[0], 'selected_option': 'C'}
+        ]}, headers=self.auth_header)
+
+        query_count, res = self.count_queries(lambda: self.client.get('/user/stats', headers=self.auth_header))
+        self.assertEqual(res.status_code, 200)
+        self.assertLessEqual(query_count, 1)
+        self.assertEqual(res.get_json(), {
+            'quizzes_created': 2,
+            'questions_created': 3,
+            'quizzes_taken': 2,
+            'total_answers': 3,
+            'average_score_percentage': 66.67
+        })
+
     # --- Quiz Management (Update/Delete) ---
     def test_update_quiz_as_creator(self):
         with app.app_context():
@@ -346,6 +892,241 @@ class FullAppTest(unittest.TestCase):
         self.assertEqual(res.status_code, 200)
         self.assertIn('updated successfully', res.get_json()['message'])
 
+    def test_quiz_payload_cache_invalidation(self):
+        quiz_id, question_ids = self.create_quiz_with_questions(['A', 'B'])
+
+        queries, res = self.count_queries(lambda: self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header))
+        self.assertGreater(queries, 0)
+        # A hit costs only the version lookup of the quiz row
+        queries, cached = self.count_queries(lambda: self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header))
+        self.assertEqual(queries, 1)
+        self.assertEqual(cached.get_json(), res.get_json())
+
+        writes = [
+            lambda: self.client.put(f'/quiz/{quiz_id}', json={'title': 'Renamed'}, headers=self.auth_header),
+            lambda: self.client.put(f'/question/{question_ids[0]}', json={'text': 'Edited?'}, headers=self.auth_header),
+            lambda: self.client.post(f'/quiz/{quiz_id}/question', json={
+                'text': 'Added?', 'option_a': 'A', 'option_b': 'B', 'option_c': 'C', 'option_d': 'D', 'correct_option': 'C'
+            }, headers=self.auth_header),
+            lambda: self.client.delete(f'/question/{question_ids[1]}', headers=self.auth_header),
+        ]
+        for write in writes:
+            self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header)
+            self.assertLess(write().status_code, 300)
+            queries, _ = self.count_queries(lambda: self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header))
+            self.assertGreater(queries, 1)
+
+        quiz = self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header).get_json()
+        self.assertEqual(quiz['title'], 'Renamed')
+        self.assertEqual([q['text'] for q in quiz['questions']], ['Edited?', 'Added?'])
+
+        # A write handled by another worker leaves this worker's entry in place, but
+        # the bumped version keeps it from being served
+        with app.app_context():
+            db.session.execute(db.update(Quiz).where(Quiz.id == quiz_id).values(
+                title='Renamed elsewhere', version=Quiz.version + 1
+            ))
+            db.session.commit()
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header).get_json()['title'],
+                         'Renamed elsewhere')
+
+        self.client.delete(f'/quiz/{quiz_id}', headers=self.auth_header)
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header).status_code, 500)
+
+    def test_full_quiz_only_for_creator(self):
+        quiz_id, _ = self.create_quiz_with_questions(['A'])
+        with app.app_context():
+            other = User(first_name='Other', last_name='Player', email='other@example.com',
+                         password_hash=generate_password_hash('password'))
+            db.session.add(other)
+            db.session.commit()
+            other_header = {'Authorization': f'Bearer {create_access_token(identity=str(other.id))}'}
+
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}').status_code, 401)
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}', headers=other_header).status_code, 403)
+        res = self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header)
+        self.assertEqual(res.status_code, 200)
+        self.assertIn('private', res.headers['Cache-Control'])
+        self.assertIn('no-cache', res.headers['Cache-Control'])
+        # Also refused when the body comes from the cache
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}', headers=other_header).status_code, 403)
+
+    def test_quiz_etags(self):
+        quiz_id, question_ids = self.create_quiz_with_questions(['A'])
+
+        for path in (f'/quiz/{quiz_id}', '/quiz', '/quiz?all=true'):
+            res = self.client.get(path, headers=self.auth_header)
+            etag = res.headers['ETag']
+            self.assertFalse(etag.startswith('W/'))
+
+            not_modified = self.client.get(path, headers=dict(self.auth_header, **{'If-None-Match': etag}))
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(not_modified.headers['ETag'], etag)
+            self.assertEqual(not_modified.get_data(), b'')
+
+        # Changing a question changes the tags of the quiz and of the catalog
+        catalog_etag = self.client.get('/quiz').headers['ETag']
+        self.client.put(f'/question/{question_ids[0]}', json={'text': 'Edited?'}, headers=self.auth_header)
+        res = self.client.get(f'/quiz/{quiz_id}', headers=dict(self.auth_header, **{'If-None-Match': f'"quiz-{quiz_id}-v1"'}))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.headers['ETag'], f'"quiz-{quiz_id}-v2"')
+        self.assertNotEqual(self.client.get('/quiz').headers['ETag'], catalog_etag)
+
+    def test_player_quiz_payload(self):
+        quiz_id, question_ids = self.create_quiz_with_questions(['A', 'C'])
+
+        res = self.client.get(f'/quiz/{quiz_id}/player')
+        self.assertEqual(res.status_code, 200)
+        quiz = res.get_json()
+        self.assertNotIn('creator_id', quiz)
+        self.assertNotIn('created_at', quiz)
+        self.assertEqual([q['id'] for q in quiz['questions']], question_ids)
+        for question in quiz['questions']:
+            self.assertNotIn('correct_option', question)
+        self.assertIn('public', res.headers['Cache-Control'])
+        self.assertIn('max-age=30', res.headers['Cache-Control'])
+        self.assertLess(len(res.get_data()), len(self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header).get_data()))
+
+        # Edits invalidate the player representation as well
+        self.client.put(f'/question/{question_ids[0]}', json={'text': 'Edited?'}, headers=self.auth_header)
+        self.assertEqual(self.client.get(f'/quiz/{quiz_id}/player').get_json()['questions'][0]['text'], 'Edited?')
+
+        # Grading happens on submit, without revealing the answer key
+        res = self.client.post(f'/quiz/{quiz_id}/answers', json={'answers': [
+            {'question_id': question_ids[0], 'selected_option': 'A'},
+            {'question_id': question_ids[1], 'selected_option': 'B'}
+        ]}, headers=self.auth_header)
+        self.assertEqual(res.get_json()['results'], [
+            {'question_id': question_ids[0], 'correct': True},
+            {'question_id': question_ids[1], 'correct': False}
+        ])
+
+    def test_response_compression(self):
+        import gzip
+        quiz_id, _ = self.create_quiz_with_questions(['A'] * 30)
+
+        plain = self.client.get(f'/quiz/{quiz_id}', headers=self.auth_header)
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.headers['Vary'])
+
+        res = self.client.get(f'/quiz/{quiz_id}', headers=dict(self.auth_header, **{'Accept-Encoding': 'gzip'}))
+        self.assertEqual(res.headers['Content-Encoding'], 'gzip')
+        self.assertLess(len(res.get_data()), len(plain.get_data()))
+        self.assertEqual(gzip.decompress(res.get_data()), plain.get_data())
+        self.assertEqual(res.headers['ETag'], 'W/' + plain.headers['ETag'])
+
+        # The weak tag of the compressed copy still revalidates
+        res = self.client.get(f'/quiz/{quiz_id}', headers=dict(self.auth_header, **{
+            'Accept-Encoding': 'gzip', 'If-None-Match': res.headers['ETag']
+        }))
+        self.assertEqual(res.status_code, 304)
+
+        # Small bodies are not worth compressing
+        res = self.client.get('/health', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', res.headers)
+
+    def test_fast_json_provider(self):
+        from datetime import datetime
+        from decimal import Decimal
+        from flask.json.provider import DefaultJSONProvider
+
+        data = {'b': [1, 2.5, None, True], 'a': 'text', 'when': datetime(2024, 1, 2, 3, 4, 5), 'price': Decimal('1.50')}
+        with app.app_context():
+            self.assertEqual(json.loads(app.json.dumps(data)), json.loads(DefaultJSONProvider(app).dumps(data)))
+            self.assertEqual(app.json.dumps({'b': 1, 'a': 2}), '{"a":2,"b":1}')
+
+    def test_fingerprinted_static_assets(self):
+        import shutil
+        import tempfile
+        from unittest import mock
+        from assets import build_assets
+
+        with tempfile.TemporaryDirectory() as tmp:
+            static_dir = os.path.join(tmp, 'static')
+            shutil.copytree(app.static_folder, static_dir, ignore=shutil.ignore_patterns('dist'))
+            manifest = build_assets(static_dir)
+
+            hashed = manifest['css/styles.css']
+            self.assertRegex(hashed, r'^dist/css/styles\.[0-9a-f]{12}\.css$')
+            self.assertEqual(build_assets(static_dir), manifest)
+
+            original_static_folder = app.static_folder
+            app.static_folder = static_dir
+            try:
+                with mock.patch.dict(app.extensions, {'asset_manifest': manifest}):
+                    page = self.client.get('/login').get_data(as_text=True)
+                    self.assertIn(f'/static/{hashed}', page)
+                    self.assertNotIn('/static/css/styles.css', page)
+
+                    res = self.client.get(f'/static/{hashed}')
+                    self.assertEqual(res.status_code, 200)
+                    self.assertEqual(res.cache_control.max_age, 31536000)
+                    self.assertTrue(res.cache_control.immutable)
+                    res.close()
+
+                    res = self.client.get('/static/css/styles.css')
+                    self.assertFalse(res.cache_control.immutable)
+                    res.close()
+            finally:
+                app.static_folder = original_static_folder
+
+    def test_cache_backends(self):
+        from unittest import mock
+        from cache import LRUCache, RedisCache
+
+        cache = LRUCache(max_entries=2, ttl=30)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual((cache.get('a'), cache.get('b'), cache.get('c')), (1, None, 3))
+        with mock.patch('cache.time.monotonic', return_value=float('inf')):
+            self.assertIsNone(cache.get('a'))
+
+        class StandInRedis(dict):
+            def set(self, key, value, ex=None):
+                self[key] = value
+
+            def delete(self, key):
+                self.pop(key, None)
+
+            def scan_iter(self, match):
+                return [key for key in list(self) if key.startswith(match.rstrip('*'))]
+
+        client = StandInRedis()
+        cache = RedisCache(client=client, prefix='test:')
+        cache.set('quiz:1', b'{}')
+        self.assertEqual(client, {'test:quiz:1': b'{}'})
+        self.assertEqual(cache.get('quiz:1'), b'{}')
+        cache.clear()
+        self.assertIsNone(cache.get('quiz:1'))
+
+        # An unreachable server behaves like an empty cache
+        class DownRedis:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise ConnectionError('connection refused')
+                return fail
+
+        cache = RedisCache(client=DownRedis())
+        with mock.patch('cache.log_error') as log_error:
+            self.assertIsNone(cache.get('quiz:1'))
+            cache.set('quiz:1', b'{}')
+            cache.delete('quiz:1')
+            cache.clear()
+        self.assertEqual(log_error.call_count, 4)
+
+    def test_quiz_cache_serves_only_current_version(self):
+        from cache import LRUCache, QuizPayloadCache
+
+        cache = QuizPayloadCache(LRUCache())
+        cache.set(1, 'full', 'quiz-1-v1', '{}')
+        self.assertEqual(cache.get(1, 'full', 'quiz-1-v1'), '{}')
+        # Built from an older version, e.g. by a lagging replica or before another worker's write
+        self.assertIsNone(cache.get(1, 'full', 'quiz-1-v2'))
+        cache.invalidate(1)
+        self.assertIsNone(cache.get(1, 'full', 'quiz-1-v1'))
+
     def test_update_question_invalid_correct_option(self):
         with app.app_context():
             quiz = Quiz(title='Quiz for Invalid Update', creator_id=self.user_id)
@@ -468,6 +1249,77 @@ class FullAppTest(unittest.TestCase):
         self.assertEqual(res.status_code, 401)
         self.assertIn('Invalid credentials', res.get_json()['error'])
 
+    def test_login_rehashes_outdated_password_hash(self):
+        with app.app_context():
+            user = db.session.get(User, self.user_id)
+            user.password_hash = generate_password_hash('123456', 'pbkdf2:sha256:1000')
+            db.session.commit()
+
+        res = self.client.post('/login', json={'email': 'test@example.com', 'password': '123456'})
+        self.assertEqual(res.status_code, 200)
+
+        with app.app_context():
+            password_hash = db.session.get(User, self.user_id).password_hash
+        hasher = app.extensions['password_hasher']
+        self.assertTrue(password_hash.startswith(hasher.method + '$'))
+        self.assertFalse(hasher.needs_rehash(password_hash))
+        self.assertTrue(hasher.verify(password_hash, '123456'))
+
+    def test_password_hashing_queue_full(self):
+        import threading
+        from unittest import mock
+
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        with mock.patch.object(app.extensions['password_hasher'], 'slots', slots):
+            res = self.client.post('/login', json={'email': 'test@example.com', 'password': '123456'})
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(res.headers['Retry-After'], '1')
+
+    def test_password_hash_method_defaults(self):
+        from passwords import PasswordHasher, normalize_method
+
+        self.assertEqual(normalize_method('scrypt'), 'scrypt:32768:8:1')
+        self.assertEqual(normalize_method('scrypt:65536'), 'scrypt:65536:8:1')
+        self.assertEqual(normalize_method('scrypt:65536:16'), 'scrypt:65536:16:1')
+        # A partial spec must not make every stored hash look outdated
+        hasher = PasswordHasher('scrypt:16384', workers=0)
+        self.assertFalse(hasher.needs_rehash(hasher.hash('secret')))
+
+    def test_password_hasher_timeout_and_broken_pool(self):
+        import os
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        from passwords import PasswordHasher, PasswordHasherBusy
+
+        hasher = PasswordHasher(workers=1, max_pending=1, timeout=0.05)
+        hasher.executor, hasher.pid = ThreadPoolExecutor(1), os.getpid()
+        done = threading.Event()
+        with self.assertRaises(PasswordHasherBusy):
+            hasher.run('hash', done.wait, 5)
+        # The slot stays taken while the abandoned job is still running
+        with self.assertRaises(PasswordHasherBusy):
+            hasher.run('hash', len, 'x')
+        done.set()
+        hasher.executor.shutdown(wait=True)
+        hasher.executor = ThreadPoolExecutor(1)
+        self.assertEqual(hasher.run('hash', len, 'abc'), 3)
+
+        class BrokenExecutor:
+            def submit(self, *args):
+                raise BrokenProcessPool()
+
+            def shutdown(self, **kwargs):
+                pass
+
+        hasher.executor = BrokenExecutor()
+        with self.assertRaises(PasswordHasherBusy):
+            hasher.run('hash', len, 'x')
+        self.assertIsNone(hasher.executor)
+        self.assertIsNone(hasher.pid)
+        self.assertTrue(hasher.slots.acquire(blocking=False))
+
     def test_create_quiz_missing_title(self):
         res = self.client.post('/quiz', json={
             'description': 'A quiz without title'
@@ -566,6 +1418,143 @@ class FullAppTest(unittest.TestCase):
         self.assertIn('total_answers', data)
         self.assertIn('average_score_percentage', data)
 
+    def test_get_metrics_cached(self):
+        app.config['METRICS_REFRESH_SECONDS'] = 60
+        app.extensions['metrics_snapshot'].refresh()
+
+        query_count, res = self.count_queries(lambda: self.client.get('/metrics'))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(query_count, 0)
+        data = res.get_json()
+        self.assertEqual(data['total_users'], 1)
+        self.assertIn('generated_at', data)
+        self.assertGreaterEqual(data['stale_seconds'], 0)
+
+        # Served from the snapshot until the next refresh
+        with app.app_context():
+            db.session.add(User(first_name='New', last_name='User', email='new@example.com', password_hash='x'))
+            db.session.commit()
+        self.assertEqual(self.client.get('/metrics').get_json()['total_users'], 1)
+
+        app.extensions['metrics_snapshot'].refresh()
+        self.assertEqual(self.client.get('/metrics').get_json()['total_users'], 2)
+
+    def test_get_metrics_prometheus(self):
+        self.client.get('/quiz')
+        res = self.client.get('/metrics/prometheus')
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.content_type.startswith('text/plain'))
+        body = res.get_data(as_text=True)
+        self.assertIn('quizapp_request_duration_seconds_bucket{endpoint="get_quizzes",le="0.005",method="GET",status="200"}', body)
+        self.assertIn('quizapp_db_queries_per_request_count{endpoint="get_quizzes"}', body)
+        self.assertIn('quizapp_requests_in_flight{endpoint="get_prometheus_metrics"}', body)
+        self.assertIn('quizapp_total_users 1.0', body)
+
+    def test_database_engine_options_from_env(self):
+        from unittest import mock
+        from config import database_engine_options
+        from metrics import InstrumentedQueuePool
+
+        self.assertEqual(database_engine_options('sqlite:///:memory:'), {})
+        env = {'DB_POOL_SIZE': '3', 'DB_MAX_OVERFLOW': '2', 'DB_POOL_PRE_PING': 'false',
+               'DB_STATEMENT_TIMEOUT_MS': '5000'}
+        with mock.patch.dict(os.environ, env):
+            options = database_engine_options('postgresql://u:p@pgpool:5432/db')
+        self.assertIs(options['poolclass'], InstrumentedQueuePool)
+        self.assertEqual(options['pool_size'], 3)
+        self.assertEqual(options['max_overflow'], 2)
+        self.assertFalse(options['pool_pre_ping'])
+        self.assertEqual(options['connect_args'], {'options': '-c statement_timeout=5000'})
+
+        # The replica bind is sized separately so it does not double the pool
+        with mock.patch.dict(os.environ, dict(env, DB_REPLICA_POOL_SIZE='1', DB_REPLICA_MAX_OVERFLOW='0')):
+            options = database_engine_options('postgresql://u:p@replica:5432/db', replica=True)
+        self.assertEqual((options['pool_size'], options['max_overflow']), (1, 0))
+
+    def test_pool_checkout_metrics(self):
+        import tempfile
+        import metrics
+        from sqlalchemy import create_engine, exc
+
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f'sqlite:///{tmp}/pool.db', poolclass=metrics.InstrumentedQueuePool,
+                                   pool_size=1, max_overflow=0, pool_timeout=0.05)
+            metrics.instrument_engine(engine)
+            waits_before = metrics.registry.get_sample_value('quizapp_db_pool_checkout_wait_seconds_count')
+            timeouts_before = metrics.registry.get_sample_value('quizapp_db_pool_timeouts_total')
+
+            conn = engine.connect()
+            self.assertEqual(metrics.registry.get_sample_value('quizapp_db_pool_saturation', {'bind': 'primary'}), 1.0)
+            with self.assertRaises(exc.TimeoutError):
+                engine.connect()
+            conn.close()
+            engine.dispose()
+
+            # Gauges follow the pool that dispose() swapped in (gunicorn disposes in the master)
+            engine = create_engine(f'sqlite:///{tmp}/pool.db', poolclass=metrics.InstrumentedQueuePool,
+                                   pool_size=2, max_overflow=0)
+            metrics.instrument_engine(engine, bind='replica')
+            engine.dispose()
+            connections = [engine.connect(), engine.connect()]
+            self.assertEqual(metrics.registry.get_sample_value(
+                'quizapp_db_pool_connections', {'bind': 'replica', 'state': 'checked_out'}), 2.0)
+            self.assertEqual(metrics.registry.get_sample_value('quizapp_db_pool_saturation', {'bind': 'replica'}), 1.0)
+            for conn in connections:
+                conn.close()
+            engine.dispose()
+
+        self.assertEqual(metrics.registry.get_sample_value('quizapp_db_pool_checkout_wait_seconds_count'), waits_before + 4)
+        self.assertEqual(metrics.registry.get_sample_value('quizapp_db_pool_timeouts_total'), timeouts_before + 1)
+
+    def test_read_replica_routing(self):
+        import tempfile
+        from unittest import mock
+        from config import create_app
+        from replicas import REPLICA_BIND, setup_read_routing
+        from routes import register_routes
+
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {'DATABASE_URL': f'sqlite:///{tmp}/primary.db', 'DATABASE_READ_URL': f'sqlite:///{tmp}/replica.db'}
+            with mock.patch.dict(os.environ, env):
+                replica_app = create_app()
+            setup_read_routing(replica_app)
+            register_routes(replica_app)
+            # The replica pool is exported next to the primary's
+            import metrics
+            with mock.patch('metrics.instrument_engine') as instrument_engine:
+                metrics.setup_prometheus(replica_app)
+            self.assertEqual([call.kwargs.get('bind', 'primary') for call in instrument_engine.call_args_list],
+                             ['primary', REPLICA_BIND])
+
+            with replica_app.app_context():
+                # The replica lags behind: each database holds a different quiz
+                db.metadata.create_all(bind=db.engines[REPLICA_BIND])
+                db.create_all()
+                for engine, title in ((db.engines[None], 'On primary'), (db.engines[REPLICA_BIND], 'On replica')):
+                    with engine.begin() as conn:
+                        conn.execute(User.__table__.insert(), {
+                            'id': 1, 'first_name': 'A', 'last_name': 'B', 'email': 'a@example.com', 'password_hash': 'x'
+                        })
+                        conn.execute(Quiz.__table__.insert(), {'title': title, 'creator_id': 1})
+
+            client = replica_app.test_client()
+            titles = lambda: [quiz['title'] for quiz in client.get('/quiz?all=true').get_json()]
+            self.assertEqual(titles(), ['On replica'])
+
+            # After a write the same client reads its own data from the primary
+            res = client.post('/register', json={
+                'first_name': 'Rep', 'last_name': 'Lica', 'email': 'replica@example.com', 'password': 'password123'
+            })
+            self.assertEqual(res.status_code, 201)
+            self.assertEqual(titles(), ['On primary'])
+
+            with replica_app.app_context():
+                db.session.remove()
+                for engine in db.engines.values():
+                    engine.dispose()
+            # The shared db registered an (empty) metadata for the bind that the test app lacks
+            db.metadatas.pop(REPLICA_BIND, None)
+
     # --- Answer Update Tests ---
     def test_submit_answer_update_existing(self):
         with app.app_context():
@@ -601,9 +1590,139 @@ class FullAppTest(unittest.TestCase):
         self.assertEqual(res2.status_code, 200)
         self.assertTrue(res2.get_json()['correct'])
 
+    def test_submit_answer_deduplication_migration(self):
+        from app import initialize_database
+        from sqlalchemy import text
+
+        quiz_id, question_ids = self.create_quiz_with_questions(['A'])
+        with app.app_context():
+            db.session.execute(text('DROP INDEX uq_answer_user_question'))
+            for option in ('B', 'C', 'A'):
+                db.session.add(Answer(
+                    user_id=self.user_id,
+                    question_id=question_ids[0],
+                    selected_option=option,
+                    is_correct=option == 'A'
+                ))
+            db.session.commit()
+
+        initialize_database()
+
+        with app.app_context():
+            answers = Answer.query.filter_by(user_id=self.user_id).all()
+            self.assertEqual([a.selected_option for a in answers], ['A'])
+
+        res = self.client.post(f'/quiz/{quiz_id}/question/{question_ids[0]}/answer', json={
+            'selected_option': 'D'
+        }, headers=self.auth_header)
+        self.assertEqual(res.status_code, 200)
+        with app.app_context():
+            self.assertEqual(Answer.query.filter_by(user_id=self.user_id).count(), 1)
+
+    def test_initialize_database_backfills_quiz_created_at(self):
+        from app import initialize_database
+        from sqlalchemy import text
+
+        with app.app_context():
+            # CREATE TABLE ... AS SELECT drops NOT NULL, like a database from before it
+            db.session.execute(text('CREATE TABLE quiz_old AS SELECT * FROM quiz'))
+            db.session.execute(text('DROP TABLE quiz'))
+            db.session.execute(text('ALTER TABLE quiz_old RENAME TO quiz'))
+            for i in range(3):
+                db.session.execute(text(
+                    "INSERT INTO quiz (id, title, topic, creator_id, created_at, version) "
+                    "VALUES (:id, :title, 'General', :creator_id, NULL, 1)"
+                ), {'id': i + 1, 'title': f'Old quiz {i}', 'creator_id': self.user_id})
+            db.session.commit()
+
+        initialize_database()
+
+        seen = []
+        cursor = None
+        while True:
+            data = self.client.get('/quiz?limit=2' + (f'&cursor={cursor}' if cursor else '')).get_json()
+            seen.extend(q['id'] for q in data['quizzes'])
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(sorted(seen), [1, 2, 3])
+
+    def test_initialize_database_creates_indexes(self):
+        from app import initialize_database
+        from sqlalchemy import inspect, text
+
+        with app.app_context():
+            db.session.execute(text('DROP INDEX ix_answer_user_id_is_correct'))
+            db.session.execute(text('DROP INDEX ix_question_quiz_id'))
+            db.session.commit()
+
+        initialize_database()
+
+        with app.app_context():
+            inspector = inspect(db.engine)
+            self.assertIn('ix_answer_user_id_is_correct', {i['name'] for i in inspector.get_indexes('answer')})
+            self.assertIn('ix_question_quiz_id', {i['name'] for i in inspector.get_indexes('question')})
+
+    def test_request_identity_resolved_once(self):
+        from unittest import mock
+        import utils as utils_module
+        from flask_jwt_extended import verify_jwt_in_request
+
+        with mock.patch.object(utils_module, 'verify_jwt_in_request', wraps=verify_jwt_in_request) as verify:
+            # Token already verified by @jwt_required is reused without decoding again
+            with app.test_request_context('/user/stats', headers=self.auth_header):
+                verify_jwt_in_request()
+                self.assertEqual(utils_module.get_request_user_id(), self.user_id)
+                self.assertEqual(utils_module.get_request_user_id(), self.user_id)
+            self.assertEqual(verify.call_count, 0)
+
+            # Public route with credentials decodes once, requests without credentials never
+            with app.test_request_context('/quiz', headers=self.auth_header):
+                self.assertEqual(utils_module.get_request_user_id(), self.user_id)
+                self.assertEqual(utils_module.get_request_user_id(), self.user_id)
+            with app.test_request_context('/static/css/styles.css'):
+                self.assertIsNone(utils_module.get_request_user_id())
+            self.assertEqual(verify.call_count, 1)
+
+    def test_async_log_handler_batches_json(self):
+        import io
+        import logging
+        import utils as utils_module
+
+        stream = io.StringIO()
+        handler = utils_module.AsyncBatchHandler(stream=stream, queue_size=100, batch_size=10)
+        handler.setFormatter(utils_module.JsonFormatter('%(message)s'))
+        test_logger = logging.getLogger('quizapp.test.async')
+        test_logger.setLevel(logging.INFO)
+        test_logger.propagate = False
+        test_logger.addHandler(handler)
+        try:
+            for i in range(25):
+                test_logger.info({'event': 'test', 'n': i})
+            test_logger.debug({'event': 'ignored'})
+            handler.flush()
+        finally:
+            test_logger.removeHandler(handler)
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual([json.loads(line)['n'] for line in lines], list(range(25)))
+        self.assertEqual(handler.dropped, 0)
+        self.assertFalse(utils_module.logger.isEnabledFor(logging.DEBUG))
+
+    def test_success_log_sampling(self):
+        from unittest import mock
+        import utils as utils_module
+
+        with mock.patch.object(utils_module, 'LOG_SUCCESS_SAMPLE_RATE', 0.0):
+            self.assertFalse(utils_module.should_log_request(200))
+            self.assertTrue(utils_module.should_log_request(404))
+            self.assertTrue(utils_module.should_log_request(500))
+        with mock.patch.object(utils_module, 'LOG_SUCCESS_SAMPLE_RATE', 1.0):
+            self.assertTrue(utils_module.should_log_request(200))
+
     # --- Error Handling Tests ---
     def test_get_nonexistent_quiz(self):
-        res = self.client.get('/quiz/99999')
+        res = self.client.get('/quiz/99999', headers=self.auth_header)
         # The global error handler catches 404s and returns 500
         self.assertEqual(res.status_code, 500)
 